@@ -15,6 +15,8 @@ from __future__ import annotations
 import time
 import uuid
 
+import numpy as np
+
 IDENTITY_TTL       = 6.0    # seconds a locked identity stays alive without a new face match
 BODY_TTL           = 3.0    # seconds before a body track is removed when not seen
 IOU_THRESH         = 0.45   # min IoU to re-associate a bbox to an existing track
@@ -30,16 +32,19 @@ _tracks: dict[int, list[dict]] = {}
 # helpers
 # ---------------------------------------------------------------------------
 
-def _iou(a: list[float], b: list[float]) -> float:
-    ax1, ay1, ax2, ay2 = a
-    bx1, by1, bx2, by2 = b
-    ix1, iy1 = max(ax1, bx1), max(ay1, by1)
-    ix2, iy2 = min(ax2, bx2), min(ay2, by2)
-    if ix2 <= ix1 or iy2 <= iy1:
-        return 0.0
-    inter = (ix2 - ix1) * (iy2 - iy1)
-    denom = (ax2 - ax1) * (ay2 - ay1) + (bx2 - bx1) * (by2 - by1) - inter
-    return inter / denom if denom > 0 else 0.0
+def iou_matrix(a: list[list[float]] | np.ndarray, b: list[list[float]] | np.ndarray) -> np.ndarray:
+    """Pairwise IoU between boxes a (N) and b (M) as an (N, M) array, in one vectorized pass."""
+    A = np.asarray(a, dtype=np.float64).reshape(-1, 4)[:, None, :]
+    B = np.asarray(b, dtype=np.float64).reshape(-1, 4)[None, :, :]
+    iw = np.clip(np.minimum(A[..., 2], B[..., 2]) - np.maximum(A[..., 0], B[..., 0]), 0.0, None)
+    ih = np.clip(np.minimum(A[..., 3], B[..., 3]) - np.maximum(A[..., 1], B[..., 1]), 0.0, None)
+    inter = iw * ih
+    denom = (
+        (A[..., 2] - A[..., 0]) * (A[..., 3] - A[..., 1])
+        + (B[..., 2] - B[..., 0]) * (B[..., 3] - B[..., 1])
+        - inter
+    )
+    return np.where(denom > 0, inter / np.where(denom > 0, denom, 1.0), 0.0)
 
 
 def _face_to_person(face_bbox: list[float], person_bboxes: list[list[float]]) -> int | None:
@@ -61,6 +66,12 @@ def _face_to_person(face_bbox: list[float], person_bboxes: list[list[float]]) ->
 # public API
 # ---------------------------------------------------------------------------
 
+def has_tracks(feed_id: int) -> bool:
+    """True while the feed has a body track seen within BODY_TTL."""
+    now = time.time()
+    return any(now - t["last_seen"] < BODY_TTL for t in _tracks.get(feed_id, ()))
+
+
 def update(
     feed_id: int,
     person_bboxes: list[list[float]],
@@ -85,22 +96,25 @@ def update(
     # -----------------------------------------------------------------------
     # Re-associate each person bbox to an existing track (greedy, best-IoU)
     # -----------------------------------------------------------------------
-    used_ids: set[str] = set()
     person_to_track: list[dict | None] = [None] * len(person_bboxes)
 
+    # IoU of every person against every existing track, computed once up front.
+    existing = list(feed_tracks)
+    ious = iou_matrix(person_bboxes, [t["bbox"] for t in existing]) if existing and person_bboxes else None
+    taken = np.zeros(len(existing), dtype=bool)
+
     for p_idx, pbbox in enumerate(person_bboxes):
         best_iou, best_t = 0.0, None
-        for t in feed_tracks:
-            if t["_id"] in used_ids:
-                continue
-            v = _iou(pbbox, t["bbox"])
-            if v > best_iou:
-                best_iou, best_t = v, t
+        if ious is not None:
+            row = np.where(taken, -1.0, ious[p_idx])
+            j = int(row.argmax())
+            if row[j] > 0.0:
+                best_iou, best_t = float(row[j]), existing[j]
 
         if best_iou >= IOU_THRESH and best_t is not None:
+            taken[j] = True
             best_t["bbox"]      = pbbox
             best_t["last_seen"] = now
-            used_ids.add(best_t["_id"])
             person_to_track[p_idx] = best_t
         else:
             new_t: dict = {
@@ -119,7 +133,6 @@ def update(
                 "last_seen":       now,
             }
             feed_tracks.append(new_t)
-            used_ids.add(new_t["_id"])
             person_to_track[p_idx] = new_t
 
     # -----------------------------------------------------------------------
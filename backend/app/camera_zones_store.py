@@ -10,40 +10,82 @@ Stored in data/camera_zones.json.
 """
 from __future__ import annotations
 
-import json
+import threading
 import uuid
 from pathlib import Path
 
+import orjson
+
 
 def _get_path(data_dir: Path) -> Path:
     return data_dir / "camera_zones.json"
 
 
-def load_camera_zones(data_dir: Path) -> list[dict]:
-    p = _get_path(data_dir)
+# Parsed zones + active-zones-by-feed index keyed by path, valid while (mtime_ns, size) holds.
+# get_zones_for_feed runs on every frame, so a stat() replaces the JSON parse and filter.
+_zones_cache: dict[Path, tuple[tuple[int, int], list[dict], dict[int, list[dict]]]] = {}
+_zones_lock = threading.Lock()  # held on a miss so concurrent frames parse the file once
+
+
+def _read(p: Path) -> list[dict]:
     if not p.exists():
         return []
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
+        return orjson.loads(p.read_bytes())
     except Exception:
         return []
 
 
+def _cached(data_dir: Path) -> tuple[list[dict], dict[int, list[dict]]]:
+    p = _get_path(data_dir)
+    try:
+        st = p.stat()
+    except OSError:
+        return [], {}
+    key = (st.st_mtime_ns, st.st_size)
+    hit = _zones_cache.get(p)
+    if hit is not None and hit[0] == key:
+        return hit[1], hit[2]
+    with _zones_lock:
+        hit = _zones_cache.get(p)
+        if hit is not None and hit[0] == key:
+            return hit[1], hit[2]
+        zones = _read(p)
+        by_feed: dict[int, list[dict]] = {}
+        for z in zones:
+            if z.get("active", True):
+                by_feed.setdefault(z.get("feed_id"), []).append(z)
+        _zones_cache[p] = (key, zones, by_feed)
+    return zones, by_feed
+
+
+def camera_zones_version(data_dir: Path) -> tuple[int, int]:
+    """Cheap change token for the zones file: (mtime_ns, size), (0, 0) if absent."""
+    try:
+        st = _get_path(data_dir).stat()
+    except OSError:
+        return (0, 0)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def load_camera_zones(data_dir: Path) -> list[dict]:
+    """Return all camera zones (cached by file mtime; treat the list as read-only)."""
+    return _cached(data_dir)[0]
+
+
 def _save(data_dir: Path, zones: list[dict]) -> None:
     p = _get_path(data_dir)
-    p.write_text(json.dumps(zones, indent=2, ensure_ascii=False), encoding="utf-8")
+    p.write_bytes(orjson.dumps(zones, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    _zones_cache.pop(p, None)
 
 
 def get_zones_for_feed(data_dir: Path, feed_id: int) -> list[dict]:
     """Return active zones for a specific camera feed."""
-    return [
-        z for z in load_camera_zones(data_dir)
-        if z.get("feed_id") == feed_id and z.get("active", True)
-    ]
+    return _cached(data_dir)[1].get(feed_id, [])
 
 
 def add_camera_zone(data_dir: Path, zone_data: dict) -> dict:
-    zones = load_camera_zones(data_dir)
+    zones = _read(_get_path(data_dir))
     zone = {
         "id": str(uuid.uuid4()),
         "feed_id": int(zone_data.get("feed_id", 0)),
@@ -60,7 +102,7 @@ def add_camera_zone(data_dir: Path, zone_data: dict) -> dict:
 
 
 def update_camera_zone(data_dir: Path, zone_id: str, updates: dict) -> dict | None:
-    zones = load_camera_zones(data_dir)
+    zones = _read(_get_path(data_dir))
     for z in zones:
         if z.get("id") == zone_id:
             for k, v in updates.items():
@@ -72,7 +114,7 @@ def update_camera_zone(data_dir: Path, zone_id: str, updates: dict) -> dict | No
 
 
 def delete_camera_zone(data_dir: Path, zone_id: str) -> bool:
-    zones = load_camera_zones(data_dir)
+    zones = _read(_get_path(data_dir))
     new_zones = [z for z in zones if z.get("id") != zone_id]
     if len(new_zones) == len(zones):
         return False
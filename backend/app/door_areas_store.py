@@ -4,9 +4,11 @@ Persisted in data/door_areas.json.
 """
 from __future__ import annotations
 
-import json
+import threading
 from pathlib import Path
 
+import orjson
+
 
 def get_door_areas_path(data_dir: Path) -> Path:
     return Path(data_dir) / "door_areas.json"
@@ -19,12 +21,44 @@ def _default_areas() -> list[dict]:
     ]
 
 
+# Parsed areas keyed by path, valid while the file's (mtime_ns, size) is unchanged.
+# Loaded on every door/feed frame, so a stat() replaces the JSON parse on the hot path.
+_areas_cache: dict[Path, tuple[tuple[int, int], list[dict]]] = {}
+_areas_lock = threading.Lock()  # held on a miss so concurrent frames parse the file once
+
+
+def door_areas_version(data_dir: Path) -> tuple[int, int]:
+    """Cheap change token for the areas file: (mtime_ns, size), (0, 0) if absent."""
+    try:
+        st = get_door_areas_path(data_dir).stat()
+    except OSError:
+        return (0, 0)
+    return (st.st_mtime_ns, st.st_size)
+
+
 def load_door_areas(data_dir: Path) -> list[dict]:
+    """Return normalized door areas (cached by file mtime; treat the list as read-only)."""
     path = get_door_areas_path(data_dir)
-    if not path.exists():
+    try:
+        st = path.stat()
+    except OSError:
         return _default_areas()
+    key = (st.st_mtime_ns, st.st_size)
+    hit = _areas_cache.get(path)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    with _areas_lock:
+        hit = _areas_cache.get(path)
+        if hit is not None and hit[0] == key:
+            return hit[1]
+        areas = _read_door_areas(path)
+        _areas_cache[path] = (key, areas)
+    return areas
+
+
+def _read_door_areas(path: Path) -> list[dict]:
     try:
-        raw = json.loads(path.read_text(encoding="utf-8"))
+        raw = orjson.loads(path.read_bytes())
     except Exception:
         return _default_areas()
     if not isinstance(raw, list) or len(raw) == 0:
@@ -47,4 +81,5 @@ def load_door_areas(data_dir: Path) -> list[dict]:
 def save_door_areas(data_dir: Path, areas: list[dict]) -> None:
     path = get_door_areas_path(data_dir)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(areas, indent=2), encoding="utf-8")
+    path.write_bytes(orjson.dumps(areas, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    _areas_cache.pop(path, None)
@@ -4,12 +4,16 @@ Significant door movement = large pixel change in door ROI (open/close), not bbo
 """
 from __future__ import annotations
 
-import io
+import time
 import urllib.request
 from pathlib import Path
 
 import numpy as np
-from PIL import Image
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
 
 # Pre-trained door model (YOLOv8 door detection for visually impaired)
 DOORS_PT_URL = "https://github.com/sayedmohamedscu/YOLOv8-Door-detection-for-visually-impaired-people/raw/main/doors.pt"
@@ -80,9 +84,13 @@ def get_door_model():
 
 
 def _image_to_bgr(image_bytes: bytes) -> np.ndarray:
-    import cv2
-    img = Image.open(io.BytesIO(image_bytes)).convert("RGB")
-    return cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
+    """Decode straight to BGR with OpenCV (libjpeg-turbo); no PIL image or RGB->BGR copy."""
+    if cv2 is None:
+        raise RuntimeError("pip install opencv-python-headless")
+    img = cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_COLOR)
+    if img is None:
+        raise ValueError("could not decode image")
+    return img
 
 
 def _bbox_iou(a: list[float], b: list[float]) -> float:
@@ -120,8 +128,8 @@ def _resolve_door_config(feed_id: int, door_config: dict | None, areas: list[dic
     )
 
 
-def _safe_fallback(feed_id: int, door_config: dict | None, areas: list[dict], hint: str | None = None) -> dict:
-    """Return response when door model is unavailable or inference fails."""
+def _attribute_person(feed_id: int, door_config: dict | None, areas: list[dict]) -> tuple[str | None, dict | None, bool]:
+    """Return (area_name, last_person, allowed) from the latest recognition on the face feed."""
     area_name, allowed_roles, face_feed_id = _resolve_door_config(feed_id, door_config, areas)
     last_person = None
     allowed = True
@@ -136,6 +144,30 @@ def _safe_fallback(feed_id: int, door_config: dict | None, areas: list[dict], hi
             }
             role = (last_person.get("role") or "Visitor").strip()
             allowed = _is_role_authorized(role, allowed_roles)
+    return area_name, last_person, allowed
+
+
+def has_door(feed_id: int, door_config: dict | None, areas: list[dict]) -> bool:
+    """True if the feed watches a door: a floor-plan door point or a door area's door_feed_id."""
+    return door_config is not None or any(a.get("door_feed_id") == feed_id for a in areas)
+
+
+def no_door_result() -> dict:
+    """Result for a feed with no door assigned: nothing to attribute, so the detector is skipped."""
+    return {
+        "doors": [],
+        "movement_detected": False,
+        "area_name": None,
+        "last_person": None,
+        "allowed": True,
+        "alert": False,
+        "hint": None,
+    }
+
+
+def _safe_fallback(feed_id: int, door_config: dict | None, areas: list[dict], hint: str | None = None) -> dict:
+    """Return response when door model is unavailable or inference fails."""
+    area_name, last_person, allowed = _attribute_person(feed_id, door_config, areas)
     return {
         "doors": [],
         "movement_detected": False,
@@ -147,17 +179,25 @@ def _safe_fallback(feed_id: int, door_config: dict | None, areas: list[dict], hi
     }
 
 
-def detect_doors(image_bytes: bytes, feed_id: int, areas: list[dict], door_config: dict | None = None) -> dict:
+def detect_doors(
+    image_bytes: bytes,
+    feed_id: int,
+    areas: list[dict],
+    door_config: dict | None = None,
+    bgr: np.ndarray | None = None,
+) -> dict:
     """
     Run door detection on image; significant movement = frame-diff in door ROI (open/close).
     Permissions from door_config (floor plan point) if set, else from areas. Same feed_id can be
     used for both face and door (one camera); last_person from _last_recognition[feed_id].
+    Pass bgr to reuse an already-decoded frame.
     Returns dict for DoorDetectResponse. On any error returns safe fallback (no 500).
     """
-    try:
-        bgr = _image_to_bgr(image_bytes)
-    except Exception:
-        return _safe_fallback(feed_id, door_config, areas, hint="Could not decode image")
+    if bgr is None:
+        try:
+            bgr = _image_to_bgr(image_bytes)
+        except Exception:
+            return _safe_fallback(feed_id, door_config, areas, hint="Could not decode image")
     h, w = bgr.shape[:2]
     diag = (w * w + h * h) ** 0.5
 
@@ -187,7 +227,6 @@ def detect_doors(image_bytes: bytes, feed_id: int, areas: list[dict], door_confi
         doors.sort(key=lambda d: (d["bbox"][2] - d["bbox"][0]) * (d["bbox"][3] - d["bbox"][1]), reverse=True)
         current_bbox = doors[0]["bbox"]
 
-    import cv2
     prev_bbox = _last_door_bbox.get(feed_id)
     prev_crop = _last_door_crop_gray.get(feed_id)
     movement_detected = False
@@ -224,38 +263,37 @@ def detect_doors(image_bytes: bytes, feed_id: int, areas: list[dict], door_confi
         _last_door_crop_gray[feed_id] = None
 
     try:
-        area_name, allowed_roles, face_feed_id = _resolve_door_config(feed_id, door_config, areas)
-        last_person = None
-        allowed = True
-        alert = False
-        if face_feed_id is not None:
-            rec = _last_recognition.get(face_feed_id)
-            if rec and rec.get("detections"):
-                d = rec["detections"][0]
-                last_person = {
-                    "name": d.get("name") or "Unknown",
-                    "role": d.get("role") or "Visitor",
-                    "identity_id": d.get("identity_id"),
-                }
-                role = (last_person.get("role") or "Visitor").strip()
-                allowed = _is_role_authorized(role, allowed_roles)
-                if movement_detected and not allowed:
-                    alert = True
-
+        area_name, last_person, allowed = _attribute_person(feed_id, door_config, areas)
         return {
             "doors": doors,
             "movement_detected": movement_detected,
             "area_name": area_name,
             "last_person": last_person,
             "allowed": allowed,
-            "alert": alert,
+            "alert": bool(last_person and movement_detected and not allowed),
             "hint": "No door detected. Point camera at the door. Run: pip install ultralytics" if not doors else None,
         }
     except Exception:
         return _safe_fallback(feed_id, door_config, areas)
 
 
+def refresh_door_access(result: dict, feed_id: int, areas: list[dict], door_config: dict | None = None) -> dict:
+    """Re-attribute last_person/allowed/alert on a detect_doors result.
+
+    Used when detect_doors ran concurrently with face recognition for the same frame, so the
+    door verdict reflects the recognition stored afterwards via set_last_recognition.
+    """
+    try:
+        area_name, last_person, allowed = _attribute_person(feed_id, door_config, areas)
+    except Exception:
+        return result
+    result["area_name"] = area_name
+    result["last_person"] = last_person
+    result["allowed"] = allowed
+    result["alert"] = bool(last_person and result.get("movement_detected") and not allowed)
+    return result
+
+
 def set_last_recognition(feed_id: int, detections: list[dict]) -> None:
     """Store last face recognition result for a feed (called from recognize endpoint)."""
-    import time
     _last_recognition[feed_id] = {"detections": detections, "timestamp": time.time()}
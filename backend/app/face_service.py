@@ -119,6 +119,8 @@ class FaceService:
         self._embeddings: np.ndarray | None = None
         self._ids: list[str] = []
         self._roles: list[str] = []
+        self.version = 0  # bumped on every faces/roles write; keys cached list responses
+        self._embs_norm: tuple[int, np.ndarray] | None = None  # (version, row-normalized embeddings)
         try:
             self.data_dir.mkdir(parents=True, exist_ok=True)
             self._load()
@@ -174,13 +176,21 @@ class FaceService:
             except Exception:
                 pass
 
+    def warmup(self) -> None:
+        """Load detector + ArcFace session and run one dummy pass so the first request is fast."""
+        dummy = np.zeros((112, 112, 3), dtype=np.uint8)
+        self._detect_faces(dummy)
+        self._embed(dummy)
+
     def _save(self):
+        self.version += 1
         self.meta_path.write_text(json.dumps(self._meta, indent=2), encoding="utf-8")
         self.ids_path.write_text(json.dumps(self._ids), encoding="utf-8")
         if self._embeddings is not None and self._embeddings.size > 0:
             np.save(self.embeddings_path, self._embeddings)
 
     def _save_roles(self):
+        self.version += 1
         self.roles_path.write_text(json.dumps(self._roles, indent=2), encoding="utf-8")
 
     def get_roles(self) -> list[str]:
@@ -343,57 +353,108 @@ class FaceService:
         self._save()
         return identity_id, f"Registered {name}"
 
-    def recognize(self, image_bytes: bytes) -> list[dict]:
-        """Detect faces, match to DB, return list of detections with bbox, identity, authorized."""
-        bgr = self._image_to_bgr(image_bytes)
-        faces = self._detect_faces(bgr)
-        if not faces:
-            return []
-        detections = []
-        threshold = RECOGNITION_THRESHOLD
-        for bbox, crop in faces:
+    def _embed_batch(self, crops: list[np.ndarray]) -> list[np.ndarray | None]:
+        """Embed several face crops in one ArcFace run. None for crops that can't be preprocessed."""
+        out: list[np.ndarray | None] = [None] * len(crops)
+        idx, inputs = [], []
+        for i, crop in enumerate(crops):
             try:
-                emb = self._embed(crop)
+                inputs.append(_preprocess_face_crop(crop))
+                idx.append(i)
             except Exception:
-                detections.append({
-                    "bbox": bbox,
-                    "identity_id": None,
-                    "name": None,
-                    "role": None,
-                    "authorized": False,
-                    "score": 0.0,
-                })
                 continue
-            emb = emb.reshape(1, -1)
-            identity_id = None
-            name = None
-            role = None
-            authorized = False
-            score = 0.0
-            if self._embeddings is not None and len(self._embeddings) > 0:
-                norms = np.linalg.norm(self._embeddings, axis=1, keepdims=True)
-                norms[norms == 0] = 1e-10
-                embs_norm = self._embeddings / norms
-                sim = (embs_norm @ emb.T).flatten()
-                idx = int(np.argmax(sim))
-                score = float(sim[idx])
-                # Only accept if above threshold AND clearly better than second-best (avoids wrong person)
-                margin_ok = True
-                if len(sim) > 1:
-                    sim_sorted = np.sort(sim)[::-1]
-                    margin_ok = (sim_sorted[0] - sim_sorted[1]) >= RECOGNITION_MARGIN
-                if score >= threshold and margin_ok:
-                    identity_id = self._ids[idx]
-                    meta = self._meta.get(identity_id, {})
-                    name = meta.get("name")
-                    role = meta.get("role", "Visitor")
-                    authorized = meta.get("authorized", True)
-            detections.append({
-                "bbox": bbox,
-                "identity_id": identity_id,
-                "name": name,
-                "role": role if identity_id else None,
-                "authorized": authorized,
-                "score": score,
-            })
-        return detections
+        if not inputs:
+            return out
+        sess, in_name, out_name = _get_arcface(self.models_dir)
+        try:
+            embs = sess.run([out_name], {in_name: np.concatenate(inputs)})[0]
+        except Exception:
+            # Model exported with a fixed batch dimension of 1
+            embs = np.concatenate([sess.run([out_name], {in_name: x})[0] for x in inputs])
+        norms = np.linalg.norm(embs, axis=1, keepdims=True)
+        embs = np.where(norms > 1e-10, embs / np.maximum(norms, 1e-10), embs).astype(np.float32)
+        for i, emb in zip(idx, embs):
+            out[i] = emb
+        return out
+
+    def _normalized_embeddings(self) -> np.ndarray | None:
+        """Row-normalized DB embeddings, recomputed only when the face DB changes."""
+        if self._embeddings is None or len(self._embeddings) == 0:
+            return None
+        if self._embs_norm is not None and self._embs_norm[0] == self.version:
+            return self._embs_norm[1]
+        norms = np.linalg.norm(self._embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1e-10
+        embs_norm = self._embeddings / norms
+        self._embs_norm = (self.version, embs_norm)
+        return embs_norm
+
+    def _match(self, bbox: list[float], emb: np.ndarray | None, embs_norm: np.ndarray | None) -> dict:
+        identity_id = None
+        name = None
+        role = None
+        authorized = False
+        score = 0.0
+        if emb is not None and embs_norm is not None:
+            sim = embs_norm @ emb
+            idx = int(np.argmax(sim))
+            score = float(sim[idx])
+            # Only accept if above threshold AND clearly better than second-best (avoids wrong person)
+            margin_ok = True
+            if len(sim) > 1:
+                top2 = np.partition(sim, -2)[-2:]
+                margin_ok = (top2[1] - top2[0]) >= RECOGNITION_MARGIN
+            if score >= RECOGNITION_THRESHOLD and margin_ok:
+                identity_id = self._ids[idx]
+                meta = self._meta.get(identity_id, {})
+                name = meta.get("name")
+                role = meta.get("role", "Visitor")
+                authorized = meta.get("authorized", True)
+        return {
+            "bbox": bbox,
+            "identity_id": identity_id,
+            "name": name,
+            "role": role if identity_id else None,
+            "authorized": authorized,
+            "score": score,
+        }
+
+    def recognize(self, image_bytes: bytes, bgr: np.ndarray | None = None) -> list[dict]:
+        """Detect faces, match to DB, return list of detections with bbox, identity, authorized.
+        Pass bgr (already-decoded frame) to skip decoding image_bytes again."""
+        if bgr is None:
+            bgr = self._image_to_bgr(image_bytes)
+        result = self.recognize_batch([bgr])[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def recognize_batch(self, images: list[bytes | np.ndarray]) -> list[list[dict] | Exception]:
+        """
+        recognize() over several frames (e.g. one per feed): faces are detected per frame, then
+        every crop from every frame is embedded in a single ArcFace run.
+        Items may be encoded bytes or decoded BGR arrays. A frame whose decode or face detection
+        fails yields that exception in its slot, so one bad frame doesn't fail the whole batch.
+        """
+        per_frame: list[list[tuple[list[float], np.ndarray]] | Exception] = []
+        for img in images:
+            try:
+                bgr = img if isinstance(img, np.ndarray) else self._image_to_bgr(img)
+                per_frame.append(self._detect_faces(bgr))
+            except Exception as e:
+                per_frame.append(e)
+        crops = [crop for faces in per_frame if not isinstance(faces, Exception) for _, crop in faces]
+        try:
+            embs = self._embed_batch(crops)
+        except Exception:
+            embs = [None] * len(crops)
+        embs_norm = self._normalized_embeddings()
+        out: list[list[dict] | Exception] = []
+        k = 0
+        for faces in per_frame:
+            if isinstance(faces, Exception):
+                out.append(faces)
+                continue
+            out.append([self._match(bbox, embs[k + j], embs_norm) for j, (bbox, _) in enumerate(faces)])
+            k += len(faces)
+        return out
@@ -1,78 +1,238 @@
 """
 Store floorplan image, zones (legacy), and doors (points). Image in data/floorplan.png.
-Zones in data/floorplan_zones.json; doors in data/floorplan_doors.json.
+Zones and doors live in data/floorplan.db (SQLite, WAL); the older floorplan_zones.json /
+floorplan_doors.json files are imported once on first open.
 """
 from __future__ import annotations
 
-import json
+import os
+import shutil
+import sqlite3
+import threading
 import uuid
+from functools import lru_cache
 from pathlib import Path
+from typing import BinaryIO
+
+import orjson
+
+
+@lru_cache(maxsize=4)
+def _data_root(data_dir: str) -> Path:
+    """Resolve data_dir to a Path and create it once (not on every call)."""
+    root = Path(data_dir)
+    root.mkdir(parents=True, exist_ok=True)
+    return root
+
+
+@lru_cache(maxsize=4)
+def _doors_path(data_dir: str) -> Path:
+    return _data_root(data_dir) / "floorplan_doors.json"
+
+
+@lru_cache(maxsize=4)
+def _zones_path(data_dir: str) -> Path:
+    return _data_root(data_dir) / "floorplan_zones.json"
+
+
+@lru_cache(maxsize=4)
+def _floorplan_path(data_dir: str) -> Path:
+    return _data_root(data_dir) / "floorplan.png"
 
 
 def get_doors_path(data_dir: Path) -> Path:
-    return Path(data_dir) / "floorplan_doors.json"
+    """Legacy JSON doors file (migrated into the SQLite store on first open)."""
+    return _doors_path(str(data_dir))
+
+
+# ---------------------------------------------------------------------------
+# SQLite store – one row per door/zone, doors indexed by feed_id.
+# The full record is kept as JSON in `data`; id/feed_id are the lookup keys.
+# ---------------------------------------------------------------------------
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS doors (id TEXT PRIMARY KEY, feed_id INTEGER, data TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS idx_doors_feed ON doors (feed_id);
+CREATE TABLE IF NOT EXISTS zones (id TEXT PRIMARY KEY, data TEXT NOT NULL);
+"""
+_db_lock = threading.RLock()
 
 
-def load_doors(data_dir: Path) -> list[dict]:
-    path = get_doors_path(data_dir)
+@lru_cache(maxsize=4)
+def _db(data_dir: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(
+        str(_data_root(data_dir) / "floorplan.db"),
+        check_same_thread=False,
+        isolation_level=None,
+    )
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_SCHEMA)
+    if conn.execute("PRAGMA user_version").fetchone()[0] == 0:
+        _migrate_json(conn, data_dir)
+    return conn
+
+
+def _read_json_list(path: Path) -> list[dict]:
     if not path.exists():
         return []
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        rows = orjson.loads(path.read_bytes())
     except Exception:
         return []
+    return [r for r in rows if isinstance(r, dict)] if isinstance(rows, list) else []
+
+
+def _migrate_json(conn: sqlite3.Connection, data_dir: str) -> None:
+    """One-time import of floorplan_doors.json / floorplan_zones.json (files are left in place)."""
+    conn.execute("BEGIN")
+    try:
+        for d in _read_json_list(_doors_path(data_dir)):
+            d.setdefault("id", str(uuid.uuid4()))
+            conn.execute(
+                "INSERT OR IGNORE INTO doors (id, feed_id, data) VALUES (?, ?, ?)",
+                (d["id"], _feed_key(d), _dumps(d)),
+            )
+        for z in _read_json_list(_zones_path(data_dir)):
+            z.setdefault("id", str(uuid.uuid4()))
+            conn.execute(
+                "INSERT OR IGNORE INTO zones (id, data) VALUES (?, ?)",
+                (z["id"], _dumps(z)),
+            )
+        conn.execute("PRAGMA user_version = 1")
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def _dumps(row: dict) -> str:
+    return orjson.dumps(row).decode()
+
+
+def _feed_key(door: dict) -> int | None:
+    try:
+        return int(door["feed_id"]) if door.get("feed_id") is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+# Parsed table contents keyed by (data_dir, table), dropped on every write to that table.
+# This process is the only writer, so no stat/poll is needed to stay current.
+_rows_cache: dict[tuple[str, str], list[dict]] = {}
+_versions: dict[tuple[str, str], int] = {}  # bumped per write; keys cached list responses
+
+
+def _load_rows(data_dir: Path, table: str) -> list[dict]:
+    key = (str(data_dir), table)
+    with _db_lock:
+        rows = _rows_cache.get(key)
+        if rows is None:
+            cur = _db(key[0]).execute(f"SELECT data FROM {table} ORDER BY rowid")
+            rows = _rows_cache[key] = [orjson.loads(r[0]) for r in cur]
+    return rows
+
+
+def _invalidate(data_dir: Path, table: str) -> None:
+    key = (str(data_dir), table)
+    _rows_cache.pop(key, None)
+    _versions[key] = _versions.get(key, 0) + 1
+    if table == "doors":
+        _door_by_feed.clear()
+
+
+def doors_version(data_dir: Path) -> int:
+    """Change token for the doors table (this process is the only writer)."""
+    return _versions.get((str(data_dir), "doors"), 0)
+
+
+def zones_version(data_dir: Path) -> int:
+    """Change token for the zones table (this process is the only writer)."""
+    return _versions.get((str(data_dir), "zones"), 0)
+
+
+def load_doors(data_dir: Path) -> list[dict]:
+    """All doors (cached until the next door write; treat the list as read-only)."""
+    return _load_rows(data_dir, "doors")
 
 
 def save_doors(data_dir: Path, doors: list[dict]) -> None:
-    path = get_doors_path(data_dir)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(doors, indent=2), encoding="utf-8")
+    """Replace all doors (bulk write; single-row helpers below are preferred)."""
+    with _db_lock:
+        conn = _db(str(data_dir))
+        conn.execute("BEGIN")
+        try:
+            conn.execute("DELETE FROM doors")
+            conn.executemany(
+                "INSERT INTO doors (id, feed_id, data) VALUES (?, ?, ?)",
+                [(d.get("id") or str(uuid.uuid4()), _feed_key(d), _dumps(d)) for d in doors],
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            _invalidate(data_dir, "doors")
 
 
 def add_door(data_dir: Path, door: dict) -> dict:
-    doors = load_doors(data_dir)
     door_id = str(uuid.uuid4())
     door["id"] = door_id
-    doors.append(door)
-    save_doors(data_dir, doors)
+    with _db_lock:
+        _db(str(data_dir)).execute(
+            "INSERT INTO doors (id, feed_id, data) VALUES (?, ?, ?)",
+            (door_id, _feed_key(door), _dumps(door)),
+        )
+        _invalidate(data_dir, "doors")
     return door
 
 
 def update_door(data_dir: Path, door_id: str, updates: dict) -> dict | None:
-    doors = load_doors(data_dir)
-    for i, d in enumerate(doors):
-        if d.get("id") == door_id:
-            doors[i] = {**d, **{k: v for k, v in updates.items() if v is not None}}
-            save_doors(data_dir, doors)
-            return doors[i]
-    return None
+    with _db_lock:
+        conn = _db(str(data_dir))
+        row = conn.execute("SELECT data FROM doors WHERE id = ?", (door_id,)).fetchone()
+        if row is None:
+            return None
+        door = {**orjson.loads(row[0]), **{k: v for k, v in updates.items() if v is not None}}
+        conn.execute(
+            "UPDATE doors SET feed_id = ?, data = ? WHERE id = ?",
+            (_feed_key(door), _dumps(door), door_id),
+        )
+        _invalidate(data_dir, "doors")
+    return door
 
 
 def delete_door(data_dir: Path, door_id: str) -> bool:
-    doors = load_doors(data_dir)
-    new_doors = [d for d in doors if d.get("id") != door_id]
-    if len(new_doors) == len(doors):
-        return False
-    save_doors(data_dir, new_doors)
-    return True
+    with _db_lock:
+        cur = _db(str(data_dir)).execute("DELETE FROM doors WHERE id = ?", (door_id,))
+        _invalidate(data_dir, "doors")
+    return cur.rowcount > 0
+
+
+# get_door_by_feed_id runs on every door/feed frame; memoize until the next door write.
+_door_by_feed: dict[tuple[str, int], dict | None] = {}
 
 
 def get_door_by_feed_id(data_dir: Path, feed_id: int) -> dict | None:
     """Return door config for the given camera feed_id (used for permissions)."""
-    for d in load_doors(data_dir):
-        if d.get("feed_id") is not None and int(d["feed_id"]) == int(feed_id):
-            return d
-    return None
+    key = (str(data_dir), int(feed_id))
+    if key in _door_by_feed:
+        return _door_by_feed[key]
+    with _db_lock:
+        row = _db(key[0]).execute(
+            "SELECT data FROM doors WHERE feed_id = ? ORDER BY rowid LIMIT 1", (key[1],)
+        ).fetchone()
+        door = orjson.loads(row[0]) if row else None
+        _door_by_feed[key] = door
+    return door
 
 
 def get_floorplan_path(data_dir: Path) -> Path:
-    data_dir = Path(data_dir)
-    data_dir.mkdir(parents=True, exist_ok=True)
-    return data_dir / "floorplan.png"
+    return _floorplan_path(str(data_dir))
 
 
 def get_zones_path(data_dir: Path) -> Path:
-    return Path(data_dir) / "floorplan_zones.json"
+    """Legacy JSON zones file (migrated into the SQLite store on first open)."""
+    return _zones_path(str(data_dir))
 
 
 def save_floorplan_image(data_dir: Path, contents: bytes) -> Path:
@@ -81,46 +241,67 @@ def save_floorplan_image(data_dir: Path, contents: bytes) -> Path:
     return path
 
 
+def save_floorplan_fileobj(data_dir: Path, fobj: BinaryIO) -> Path:
+    """Stream an upload (e.g. UploadFile.file) to floorplan.png without buffering it in memory."""
+    path = get_floorplan_path(data_dir)
+    tmp = path.with_suffix(".png.tmp")
+    with tmp.open("wb") as dst:
+        shutil.copyfileobj(fobj, dst, 1024 * 1024)
+    os.replace(tmp, path)
+    return path
+
+
 def has_floorplan(data_dir: Path) -> bool:
     return get_floorplan_path(data_dir).exists()
 
 
 def load_zones(data_dir: Path) -> list[dict]:
-    path = get_zones_path(data_dir)
-    if not path.exists():
-        return []
-    return json.loads(path.read_text(encoding="utf-8"))
+    """All floor plan zones (cached until the next zone write; treat the list as read-only)."""
+    return _load_rows(data_dir, "zones")
 
 
 def save_zones(data_dir: Path, zones: list[dict]) -> None:
-    path = get_zones_path(data_dir)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(zones, indent=2), encoding="utf-8")
+    """Replace all zones (bulk write; single-row helpers below are preferred)."""
+    with _db_lock:
+        conn = _db(str(data_dir))
+        conn.execute("BEGIN")
+        try:
+            conn.execute("DELETE FROM zones")
+            conn.executemany(
+                "INSERT INTO zones (id, data) VALUES (?, ?)",
+                [(z.get("id") or str(uuid.uuid4()), _dumps(z)) for z in zones],
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            _invalidate(data_dir, "zones")
 
 
 def add_zone(data_dir: Path, zone: dict) -> dict:
-    zones = load_zones(data_dir)
     zone_id = str(uuid.uuid4())
     zone["id"] = zone_id
-    zones.append(zone)
-    save_zones(data_dir, zones)
+    with _db_lock:
+        _db(str(data_dir)).execute("INSERT INTO zones (id, data) VALUES (?, ?)", (zone_id, _dumps(zone)))
+        _invalidate(data_dir, "zones")
     return zone
 
 
 def update_zone(data_dir: Path, zone_id: str, updates: dict) -> dict | None:
-    zones = load_zones(data_dir)
-    for i, z in enumerate(zones):
-        if z.get("id") == zone_id:
-            zones[i] = {**z, **{k: v for k, v in updates.items() if v is not None}}
-            save_zones(data_dir, zones)
-            return zones[i]
-    return None
+    with _db_lock:
+        conn = _db(str(data_dir))
+        row = conn.execute("SELECT data FROM zones WHERE id = ?", (zone_id,)).fetchone()
+        if row is None:
+            return None
+        zone = {**orjson.loads(row[0]), **{k: v for k, v in updates.items() if v is not None}}
+        conn.execute("UPDATE zones SET data = ? WHERE id = ?", (_dumps(zone), zone_id))
+        _invalidate(data_dir, "zones")
+    return zone
 
 
 def delete_zone(data_dir: Path, zone_id: str) -> bool:
-    zones = load_zones(data_dir)
-    new_zones = [z for z in zones if z.get("id") != zone_id]
-    if len(new_zones) == len(zones):
-        return False
-    save_zones(data_dir, new_zones)
-    return True
+    with _db_lock:
+        cur = _db(str(data_dir)).execute("DELETE FROM zones WHERE id = ?", (zone_id,))
+        _invalidate(data_dir, "zones")
+    return cur.rowcount > 0
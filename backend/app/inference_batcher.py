@@ -0,0 +1,93 @@
+"""
+Micro-batching of model inference across concurrent requests (one frame per camera feed).
+
+Endpoints submit a single frame and await its result. A background task collects frames that
+arrive within a short window (or until MAX_BATCH is reached) and runs one batched call in the
+threadpool, so N feeds polling at the same time cost one forward pass instead of N.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import nullcontext
+from typing import Any, Callable, Hashable
+
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+MAX_BATCH = 16
+BATCH_WINDOW = 0.015  # seconds to wait for more frames after the first one arrives
+
+
+class MicroBatcher:
+    """
+    Coalesce submit() calls into batch_fn(items) -> results (same length and order).
+
+    If the queue backs up and several frames for the same key (feed_id) land in one batch,
+    only the newest is inferred; the superseded requests receive that newer frame's result.
+    batch_fn may return an exception instance in an item's slot; that item's submit() raises it.
+    If limiter is given, each batch holds it for the forward pass (not while frames queue).
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[Any]], list[Any]],
+        max_batch: int = MAX_BATCH,
+        window: float = BATCH_WINDOW,
+        limiter: asyncio.Semaphore | None = None,
+    ):
+        self._batch_fn = batch_fn
+        self._max_batch = max_batch
+        self._window = window
+        self._limiter = limiter
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+
+    async def submit(self, item: Any, key: Hashable | None = None) -> Any:
+        loop = asyncio.get_running_loop()
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+        fut = loop.create_future()
+        self._queue.put_nowait((key, item, fut))
+        return await fut
+
+    async def _collect(self) -> list[tuple]:
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self._window
+        while len(batch) < self._max_batch:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            keys = [key if key is not None else ("#", n) for n, (key, _, _) in enumerate(batch)]
+            newest = {k: n for n, k in enumerate(keys)}  # last submission per key wins
+            run_idx = sorted(newest.values())
+            try:
+                async with self._limiter if self._limiter is not None else nullcontext():
+                    results = await run_in_threadpool(self._batch_fn, [batch[n][1] for n in run_idx])
+            except Exception as e:
+                logger.warning("Batched inference failed: %s", e)
+                for _, _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+                continue
+            by_key = {keys[n]: res for n, res in zip(run_idx, results)}
+            for k, (_, _, fut) in zip(keys, batch):
+                if fut.done():
+                    continue
+                if isinstance(by_key[k], BaseException):
+                    fut.set_exception(by_key[k])
+                else:
+                    fut.set_result(by_key[k])
@@ -2,11 +2,21 @@
 FastAPI backend: face registration, recognition, door detection, zone enforcement,
 and security alert logging.
 """
-import io
+import asyncio
+import hashlib
 import logging
+import mimetypes
+import multiprocessing
+import os
+import stat
 import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager, nullcontext
 from pathlib import Path
+from typing import Callable, Hashable
 
 # Optional: load .env for ELEVENLABS_*, TWILIO_*, C_LEVEL_PHONE_NUMBERS, PUBLIC_BASE_URL
 try:
@@ -15,37 +25,46 @@ try:
 except ImportError:
     pass
 
+import cv2
+import numpy as np
+import orjson
 from pydantic import BaseModel
-from fastapi import FastAPI, File, Form, UploadFile, HTTPException
+from fastapi import BackgroundTasks, FastAPI, File, Form, Query, Request, UploadFile, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse, Response
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.staticfiles import NotModifiedResponse
 
 logger = logging.getLogger(__name__)
 
 from app.camera_zones_store import (
     add_camera_zone,
+    camera_zones_version,
     delete_camera_zone,
     get_zones_for_feed,
     load_camera_zones,
     update_camera_zone,
 )
-from app.door_areas_store import load_door_areas, save_door_areas
-from app.door_service import detect_doors, set_last_recognition
+from app.door_areas_store import door_areas_version, load_door_areas, save_door_areas
+from app.door_service import detect_doors, has_door, no_door_result, refresh_door_access, set_last_recognition
 from app.face_service import FaceService
 from app.floorplan_store import (
     add_door,
     add_zone,
     delete_door,
     delete_zone,
+    doors_version,
     get_door_by_feed_id,
     get_floorplan_path,
     has_floorplan,
     load_doors,
     load_zones,
-    save_floorplan_image,
+    save_floorplan_fileobj,
     update_door,
     update_zone,
+    zones_version,
 )
 from app.schemas import (
     AlertsListResponse,
@@ -76,17 +95,67 @@ from app.schemas import (
     ZonesListResponse,
 )
 from app.security_service import (
+    MAX_ALERTS,
     acknowledge_alert,
+    alerts_version,
     clear_alerts,
+    compact_alerts,
+    flush_alerts,
+    get_alert,
     get_alerts,
     log_alert,
+    new_alert_id,
     resolve_alert,
+    update_alert,
 )
 from app.twilio_service import send_zone_alert_sms
-from app.zone_service import check_zones, detect_persons, should_log_alert
+from app.zone_service import check_zones, detect_persons_batch, should_log_alert
+from app.inference_batcher import MicroBatcher
 from app import body_tracker
 
-app = FastAPI(title="Hof Capital Inspection API", version="0.1.0")
+def _warmup_models(svc: FaceService) -> None:
+    """Load every model once and run it on a dummy frame (kernel init, session creation)."""
+    try:
+        svc.warmup()
+    except Exception as e:
+        logger.warning("Face model warmup failed: %s", e)
+    dummy = np.zeros((64, 64, 3), dtype=np.uint8)
+    from app.door_service import get_door_model
+    from app.zone_service import get_person_model
+    for name, getter in (("person", get_person_model), ("door", get_door_model)):
+        try:
+            model = getter()
+            if model is not None:
+                model.predict(dummy, verbose=False)
+        except Exception as e:
+            logger.warning("%s model warmup failed: %s", name.capitalize(), e)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build FaceService and warm all models before the server accepts traffic."""
+    global _face_service, _pdf_pool
+    _face_service = FaceService(data_dir=_data_dir)
+    await run_in_threadpool(compact_alerts, _data_dir)
+    await run_in_threadpool(_warmup_models, _face_service)
+    # Pydantic v2 compiles validators at class creation; the OpenAPI/JSON schema is the only
+    # lazy part left, so build it here rather than on the first /docs or /openapi.json hit.
+    app.openapi()
+    # Spawned, not forked: by now ONNX/YOLO and the threadpool have live threads, and forking a
+    # multi-threaded process can leave a worker holding a lock that no thread will release.
+    _pdf_pool = ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn"))
+    yield
+    _pdf_pool.shutdown(wait=False, cancel_futures=True)
+    _pdf_pool = None
+    flush_alerts()
+
+
+app = FastAPI(
+    title="Hof Capital Inspection API",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # dashboard polls the list endpoints
+)
 
 
 @app.exception_handler(Exception)
@@ -110,47 +179,198 @@ _data_dir = Path(__file__).resolve().parent.parent / "data"
 _data_dir.mkdir(parents=True, exist_ok=True)
 _face_service: FaceService | None = None
 
+# Caps concurrent model inference across feeds so parallel pipelines don't oversubscribe the
+# CPU/GPU (FACEY_MAX_INFER, default 4). Direct detector calls acquire it per call; the batchers
+# acquire it once per batched forward pass, so requests waiting on a batch don't hold a slot.
+_infer_sem = asyncio.Semaphore(max(1, int(os.environ.get("FACEY_MAX_INFER", "4"))))
+# Person detection from concurrent feeds is coalesced into one batched YOLO pass.
+_person_batcher = MicroBatcher(detect_persons_batch, limiter=_infer_sem)
+_face_batcher = MicroBatcher(lambda frames: get_face_service().recognize_batch(frames), limiter=_infer_sem)
+
+
+async def _limited_inference(fn: Callable, *args, **kwargs):
+    """run_in_threadpool(fn, ...) while holding an _infer_sem slot."""
+    async with _infer_sem:
+        return await run_in_threadpool(fn, *args, **kwargs)
+
 # ---------------------------------------------------------------------------
 # Frame buffer – keeps last ~3 s of frames per feed for violation recordings
 # ---------------------------------------------------------------------------
 _FRAME_BUFFER_MAX = 8           # 8 × 400 ms ≈ 3.2 s
-_frame_buffers: dict[int, list[bytes]] = {}
+# (arrival time, JPEG bytes) per feed. One tuple per append keeps the pair consistent for the
+# recorder, which snapshots the ring from a worker thread while the event loop keeps appending.
+_frame_buffers: dict[int, deque[tuple[float, bytes]]] = {}
 
 
 def _buffer_frame(feed_id: int, image_bytes: bytes) -> None:
-    buf = _frame_buffers.setdefault(feed_id, [])
-    buf.append(image_bytes)
-    if len(buf) > _FRAME_BUFFER_MAX:
-        buf.pop(0)
+    buf = _frame_buffers.get(feed_id)
+    if buf is None:
+        buf = _frame_buffers.setdefault(feed_id, deque(maxlen=_FRAME_BUFFER_MAX))
+    buf.append((time.monotonic(), image_bytes))
+
+
+# ---------------------------------------------------------------------------
+# Duplicate-frame cache – a stalled feed re-POSTs the same JPEG; reuse the response
+# ---------------------------------------------------------------------------
+_FRAME_CACHE_TTL = 0.4  # seconds
+_frame_cache: dict[tuple[str, int], tuple[bytes, float, dict]] = {}
+
+
+def _frame_digest(contents: bytes) -> bytes:
+    return hashlib.blake2b(contents, digest_size=8).digest()
+
+
+def _cached_frame_response(endpoint: str, feed_id: int, digest: bytes) -> dict | None:
+    """Return the assembled response for an identical frame seen within the TTL, else None."""
+    hit = _frame_cache.get((endpoint, feed_id))
+    if hit and hit[0] == digest and time.monotonic() - hit[1] < _FRAME_CACHE_TTL:
+        return hit[2]
+    return None
+
+
+def _remember_frame_response(endpoint: str, feed_id: int, digest: bytes, payload: dict) -> None:
+    _frame_cache[(endpoint, feed_id)] = (digest, time.monotonic(), payload)
+
+
+# ---------------------------------------------------------------------------
+# Static-scene gate – near-identical consecutive frames (8x8 average hash within
+# _AHASH_MAX_DISTANCE bits, < _AHASH_MAX_AGE old) reuse the last face/person results.
+# FACEY_NO_FRAME_SKIP_FEEDS="0,3" disables the gate for high-risk feeds.
+# ---------------------------------------------------------------------------
+_AHASH_MAX_DISTANCE = 4
+_AHASH_MAX_AGE = 0.5  # seconds
+_AHASH_IDLE_MAX_AGE = 4.0  # cap for feeds whose recent frames held no faces or persons
+_last_hash: dict[int, tuple[int, float, list[dict], list[dict]]] = {}
+_idle_streak: dict[int, int] = {}  # consecutive inferred frames with nothing in them
+_NO_FRAME_SKIP_FEEDS = {
+    int(x) for x in os.environ.get("FACEY_NO_FRAME_SKIP_FEEDS", "").split(",") if x.strip().isdigit()
+}
+
+
+# ---------------------------------------------------------------------------
+# Person-detection gate for feed/analyze. Its persons only feed the body tracker, so they are
+# skipped on feeds with no camera zones, no door, no live body track and no face last frame.
+# ---------------------------------------------------------------------------
+_feeds_with_faces: set[int] = set()
+
+
+def _needs_persons(feed_id: int, door_config: dict | None) -> bool:
+    return bool(
+        feed_id in _feeds_with_faces
+        or body_tracker.has_tracks(feed_id)
+        or door_config
+        or get_zones_for_feed(_data_dir, feed_id)
+    )
+
+
+def _average_hash(bgr: np.ndarray | None) -> int | None:
+    """64-bit aHash: 8x8 grayscale thumbnail thresholded at its mean."""
+    if bgr is None:
+        return None
+    small = cv2.resize(cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY), (8, 8), interpolation=cv2.INTER_AREA)
+    return int.from_bytes(np.packbits(small > small.mean()).tobytes(), "big")
+
+
+def _reusable_frame_results(feed_id: int, ahash: int | None) -> tuple[list[dict], list[dict]] | None:
+    """Return (face_dicts, persons) of the last processed frame if this one is near-identical."""
+    if ahash is None or feed_id in _NO_FRAME_SKIP_FEEDS:
+        return None
+    last = _last_hash.get(feed_id)
+    if last is None:
+        return None
+    # Empty, static scenes back off exponentially: 0.5 s, 1 s, 2 s ... up to the idle cap.
+    max_age = min(_AHASH_MAX_AGE * 2 ** _idle_streak.get(feed_id, 0), _AHASH_IDLE_MAX_AGE)
+    if time.monotonic() - last[1] >= max_age:
+        return None
+    if (last[0] ^ ahash).bit_count() > _AHASH_MAX_DISTANCE:
+        return None
+    return last[2], last[3]
+
+
+def _decode_frame(contents: bytes) -> np.ndarray | None:
+    """Decode an uploaded frame once (BGR) so every model in the request can share it."""
+    try:
+        return cv2.imdecode(np.frombuffer(contents, np.uint8), cv2.IMREAD_COLOR)
+    except cv2.error:
+        return None
+
+
+# feed/analyze runs every model on a copy no taller than this; bboxes are scaled back up.
+_ANALYZE_MAX_HEIGHT = int(os.environ.get("FACEY_ANALYZE_MAX_HEIGHT", "720"))
+
+
+def _downscale_frame(bgr: np.ndarray | None) -> tuple[np.ndarray | None, float]:
+    """Return (frame, scale): frames taller than _ANALYZE_MAX_HEIGHT are shrunk (INTER_AREA)."""
+    if bgr is None or bgr.shape[0] <= _ANALYZE_MAX_HEIGHT:
+        return bgr, 1.0
+    scale = _ANALYZE_MAX_HEIGHT / bgr.shape[0]
+    return cv2.resize(bgr, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA), scale
+
+
+def _rescale_bboxes(items: list[dict], factor: float, key: str = "bbox") -> list[dict]:
+    """Copies of items with items[key] ([x1,y1,x2,y2] pixels) multiplied by factor."""
+    if factor == 1.0:
+        return items
+    return [{**d, key: [v * factor for v in d[key]]} if d.get(key) else d for d in items]
+
+
+def _sniff_image(contents: bytes) -> str | None:
+    """
+    Return the image media type from magic bytes (PNG/JPEG/WebP), or None.
+    This is the upload check: the client's Content-Type header is not trusted either way.
+    """
+    if contents[:8] == b"\x89PNG\r\n\x1a\n":
+        return "image/png"
+    if contents[:3] == b"\xff\xd8\xff":
+        return "image/jpeg"
+    if contents[:4] == b"RIFF" and contents[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+# GIF encoding runs off the request path; the URL is returned as soon as work is queued.
+_rec_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="recording")
+_pending_recordings: dict[str, Future] = {}
+
+
+def _gif_durations(times: list[float]) -> list[int]:
+    """Per-frame GIF durations (ms) from capture times, so playback matches the real pacing."""
+    gaps = [min(max(round((b - a) * 1000), 50), 2000) for a, b in zip(times, times[1:])]
+    return gaps + [gaps[-1] if gaps else 400]
 
 
-def _save_recording(alert_id: str, feed_id: int) -> str | None:
-    """Save the last ~3 s of frames for feed_id as an animated GIF.
-    Returns the URL path or None if no frames are available."""
+def _encode_recording(alert_id: str, frames: list[tuple[float, bytes]]) -> bool:
+    """Encode buffered frames as an animated GIF and upload it. Runs on _rec_executor."""
     try:
         from PIL import Image as _Img
-        frames = _frame_buffers.get(feed_id, [])
-        if not frames:
-            return None
         rec_dir = _data_dir / "recordings"
         rec_dir.mkdir(parents=True, exist_ok=True)
         path = rec_dir / f"{alert_id}.gif"
+        # Decode + downscale with OpenCV (libjpeg-turbo, SIMD); PIL only encodes the GIF.
         imgs: list[_Img.Image] = []
-        for fb in frames:
-            try:
-                img = _Img.open(io.BytesIO(fb)).convert("RGB")
-                img.thumbnail((320, 240), _Img.LANCZOS)
-                imgs.append(img)
-            except Exception:
+        times: list[float] = []
+        for ts, fb in frames:
+            arr = cv2.imdecode(np.frombuffer(fb, np.uint8), cv2.IMREAD_COLOR)
+            if arr is None:
                 continue
+            h, w = arr.shape[:2]
+            scale = min(320 / w, 240 / h)
+            if scale < 1.0:
+                arr = cv2.resize(
+                    arr,
+                    (max(1, round(w * scale)), max(1, round(h * scale))),
+                    interpolation=cv2.INTER_AREA,
+                )
+            imgs.append(_Img.fromarray(cv2.cvtColor(arr, cv2.COLOR_BGR2RGB)))
+            times.append(ts)
         if not imgs:
-            return None
+            return False
         imgs[0].save(
             path,
             save_all=True,
             append_images=imgs[1:],
             loop=0,
-            duration=400,
+            duration=_gif_durations(times),
             optimize=False,
         )
         # Upload GIF to Supabase Storage
@@ -162,13 +382,51 @@ def _save_recording(alert_id: str, feed_id: int) -> str | None:
                 update_incident_field(alert_id, recording_storage_path=f"{alert_id}.gif")
         except Exception as e:
             logger.debug("Supabase recording upload skipped: %s", e)
-        return f"/api/security/recordings/{alert_id}"
+        return True
     except Exception as e:
         logger.warning("Could not save recording: %s", e)
-        return None
+        return False
+
+
+def _snapshot_frames(feed_id: int) -> list[tuple[float, bytes]]:
+    """The last ~3 s of buffered frames for feed_id (a copy: the buffer keeps rolling)."""
+    return list(_frame_buffers.get(feed_id, ()))
+
+
+def _recording_url(alert_id: str, frames: list[tuple[float, bytes]]) -> str | None:
+    return f"/api/security/recordings/{alert_id}" if frames else None
+
+
+def _recording_done(alert_id: str, fut: Future) -> None:
+    _pending_recordings.pop(alert_id, None)
+    if fut.cancelled() or fut.exception() is not None or not fut.result():
+        # The alert was logged with the URL up front; don't leave it pointing at a 404.
+        update_alert(_data_dir, alert_id, recording_url=None)
+
+
+def _save_recording(alert_id: str, frames: list[tuple[float, bytes]]) -> None:
+    """Queue frames (from _snapshot_frames) to be saved as an animated GIF for alert_id.
+    Call after the alert is logged, so a failed encode can clear its recording_url."""
+    if not frames:
+        return
+    fut = _rec_executor.submit(_encode_recording, alert_id, frames)
+    _pending_recordings[alert_id] = fut
+    fut.add_done_callback(lambda f: _recording_done(alert_id, f))
+
+
+def _wait_for_recording(alert_id: str, timeout: float = 30.0) -> None:
+    """Block until a queued recording for alert_id is written (no-op if none pending)."""
+    fut = _pending_recordings.get(alert_id)
+    if fut is None:
+        return
+    try:
+        fut.result(timeout=timeout)
+    except Exception:
+        pass
 
 
 def get_face_service() -> FaceService:
+    """Return the FaceService built at startup (constructed here only outside the lifespan)."""
     global _face_service
     if _face_service is None:
         _face_service = FaceService(data_dir=_data_dir)
@@ -178,20 +436,40 @@ def get_face_service() -> FaceService:
 # ---------------------------------------------------------------------------
 # Feature 1 helper – door alert logging with per-feed cooldown
 # ---------------------------------------------------------------------------
+# One frame per feed at a time. Per-feed state (door ROI diffs, body tracks, line sides,
+# cooldowns) is touched from threadpool workers, so frames of the same feed are serialized
+# while different feeds still run concurrently.
+_feed_locks: dict[int, asyncio.Lock] = {}
+
+
+def _feed_lock(feed_id: int) -> asyncio.Lock:
+    lock = _feed_locks.get(feed_id)
+    if lock is None:
+        lock = _feed_locks[feed_id] = asyncio.Lock()
+    return lock
+
+
 _door_alert_cooldown: dict[int, float] = {}
 _DOOR_ALERT_COOLDOWN = 15.0  # seconds between logged alerts for the same feed
 
 
-def _maybe_log_door_alert(feed_id: int, door_result: dict) -> None:
-    """Log an unauthorized-door-access alert if the cooldown has elapsed."""
+def _door_alert_due(feed_id: int, door_result: dict) -> bool:
+    """Cooldown gate for door alerts; runs inline so concurrent frames can't double-log."""
     if not door_result.get("alert"):
-        return
+        return False
     now = time.time()
     if now - _door_alert_cooldown.get(feed_id, 0.0) < _DOOR_ALERT_COOLDOWN:
-        return
+        return False
     _door_alert_cooldown[feed_id] = now
+    return True
+
+
+def _log_door_alert(feed_id: int, door_result: dict) -> None:
+    """Log an unauthorized-door-access alert (runs as a background task after the response)."""
     last = door_result.get("last_person") or {}
-    alert = log_alert(
+    alert_id = new_alert_id()
+    frames = _snapshot_frames(feed_id)
+    log_alert(
         _data_dir,
         alert_type="unauthorized_door_access",
         feed_id=feed_id,
@@ -203,16 +481,10 @@ def _maybe_log_door_alert(feed_id: int, door_result: dict) -> None:
             f"Unauthorized access attempt at '{door_result.get('area_name', 'door')}' – "
             "door movement detected with unrecognized or unauthorized face"
         ),
+        recording_url=_recording_url(alert_id, frames),
+        alert_id=alert_id,
     )
-    rec_url = _save_recording(alert["alert_id"], feed_id)
-    if rec_url:
-        from app.security_service import _load as _sload, _save as _ssave
-        saved = _sload(_data_dir)
-        for a in saved:
-            if a.get("alert_id") == alert["alert_id"]:
-                a["recording_url"] = rec_url
-                break
-        _ssave(_data_dir, saved)
+    _save_recording(alert_id, frames)
 
 
 # ---------------------------------------------------------------------------
@@ -223,11 +495,8 @@ def _generate_incident_report_bg(alert_id: str, frame_bytes: bytes) -> None:
     """Generate a PDF incident report in a background thread and link it to the alert."""
     try:
         from app.ai_analysis_service import analyze_frame_with_nemotron, escalate_with_nemotron_super, write_report_with_claude
-        from app.report_service import generate_pdf_report
-        from app.security_service import _load as _sload, _save as _ssave
 
-        alerts = _sload(_data_dir)
-        alert = next((a for a in alerts if a.get("alert_id") == alert_id), None)
+        alert = get_alert(_data_dir, alert_id)
         if not alert:
             logger.warning("Auto-report: alert %s not found", alert_id)
             return
@@ -283,15 +552,11 @@ def _generate_incident_report_bg(alert_id: str, frame_bytes: bytes) -> None:
                 audio_url = f"/api/security/alerts/{alert_id}/audio"
                 logger.info("Auto-report: ElevenLabs TTS saved for %s", alert_id)
                 # Save audio_url to alert JSON immediately so dashboard picks it up
-                alerts = _sload(_data_dir)
-                for a in alerts:
-                    if a.get("alert_id") == alert_id:
-                        a["audio_url"] = audio_url
-                        if escalation:
-                            a["escalation_level"] = escalation.get("escalation_level")
-                            a["escalation_reasoning"] = escalation.get("reasoning")
-                        break
-                _ssave(_data_dir, alerts)
+                patch = {"audio_url": audio_url}
+                if escalation:
+                    patch["escalation_level"] = escalation.get("escalation_level")
+                    patch["escalation_reasoning"] = escalation.get("reasoning")
+                update_alert(_data_dir, alert_id, **patch)
         except Exception as e:
             logger.debug("ElevenLabs TTS skipped: %s", e)
 
@@ -299,23 +564,39 @@ def _generate_incident_report_bg(alert_id: str, frame_bytes: bytes) -> None:
         report_text = write_report_with_claude(alert, nemotron, escalation)
         logger.info("Auto-report: Claude report done for %s", alert_id)
 
-        # Step 5: ReportLab generates the branded PDF
-        pdf_bytes = generate_pdf_report(alert, nemotron, report_text, _data_dir, escalation)
+        # Step 5: ReportLab generates the branded PDF (embeds a frame from the recording GIF)
+        _wait_for_recording(alert_id)
+        pdf_bytes = _render_pdf(alert, nemotron, report_text, escalation)
 
         # Save PDF and threat image locally
         reports_dir = _data_dir / "incident_reports"
         reports_dir.mkdir(parents=True, exist_ok=True)
-        pdf_path = reports_dir / f"{alert_id}.pdf"
-        pdf_path.write_bytes(pdf_bytes)
-
+        # tmp file + os.replace: generate_security_report serves an existing PDF as-is, so it must
+        # never see a half-written one. The image goes first so it is in place once the PDF is.
         img_path = reports_dir / f"{alert_id}_threat.jpg"
-        img_path.write_bytes(frame_bytes)
+        _write_atomic(img_path, frame_bytes)
+
+        pdf_path = reports_dir / f"{alert_id}.pdf"
+        _write_atomic(pdf_path, pdf_bytes)
+
+        # Link report to the local alert JSON first so the dashboard doesn't wait on the uploads
+        patch = {
+            "report_url": f"/api/security/reports/{alert_id}",
+            "threat_image_url": f"/api/security/reports/{alert_id}/image",
+        }
+        if escalation:
+            patch["escalation_level"] = escalation.get("escalation_level")
+            patch["escalation_reasoning"] = escalation.get("reasoning")
+        update_alert(_data_dir, alert_id, **patch)
+        logger.info("Auto-report: PDF saved and linked for %s", alert_id)
 
-        # Upload to Supabase Storage
+        # Upload to Supabase Storage (PDF and threat image in parallel)
         try:
-            from app.supabase_service import upload_report, upload_threat_image, update_incident_field
-            upload_report(alert_id, pdf_bytes)
-            upload_threat_image(alert_id, frame_bytes)
+            from app.supabase_service import upload_files, update_incident_field
+            upload_files([
+                ("reports", f"{alert_id}.pdf", pdf_bytes, "application/pdf"),
+                ("threat-images", f"{alert_id}.jpg", frame_bytes, "image/jpeg"),
+            ])
             sb_fields = {
                 "report_storage_path": f"{alert_id}.pdf",
                 "threat_image_storage_path": f"{alert_id}.jpg",
@@ -329,90 +610,144 @@ def _generate_incident_report_bg(alert_id: str, frame_bytes: bytes) -> None:
         except Exception as e:
             logger.debug("Supabase report upload skipped: %s", e)
 
-        # Link report to the local alert JSON
-        alerts = _sload(_data_dir)
-        for a in alerts:
-            if a.get("alert_id") == alert_id:
-                a["report_url"] = f"/api/security/reports/{alert_id}"
-                a["threat_image_url"] = f"/api/security/reports/{alert_id}/image"
-                if escalation:
-                    a["escalation_level"] = escalation.get("escalation_level")
-                    a["escalation_reasoning"] = escalation.get("reasoning")
-                break
-        _ssave(_data_dir, alerts)
-        logger.info("Auto-report: PDF saved and linked for %s", alert_id)
-
     except Exception:
         logger.exception("Auto-report generation failed for %s", alert_id)
 
 
+# ReportLab layout is pure-Python CPU work that holds the GIL for its whole run; render PDFs
+# in worker processes so a report doesn't stall frame inference threads. Created in lifespan.
+_pdf_pool: ProcessPoolExecutor | None = None
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _render_pdf(alert: dict, nemotron: dict, report_text: str, escalation: dict | None = None) -> bytes:
+    """generate_pdf_report in _pdf_pool (blocks the calling thread until done)."""
+    from app.report_service import generate_pdf_report
+    pool = _pdf_pool
+    try:
+        if pool is not None:
+            return pool.submit(
+                generate_pdf_report, alert, nemotron, report_text, _data_dir, escalation
+            ).result()
+    except (BrokenProcessPool, RuntimeError):
+        # RuntimeError: submitted after shutdown (a report still running while the app stops).
+        logger.warning("PDF worker pool unavailable; rendering in-process")
+    return generate_pdf_report(alert, nemotron, report_text, _data_dir, escalation)
+
+
+# Report generation (LLM calls + PDF) runs on a small fixed pool. At most
+# _REPORT_QUEUE_MAX jobs may be queued or running; an alert burst beyond that is dropped
+# rather than piling up threads and frame copies.
+_REPORT_QUEUE_MAX = 8
+_report_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="report")
+_report_slots = threading.BoundedSemaphore(_REPORT_QUEUE_MAX)
+
+
 def _auto_generate_report(alert_id: str, frame_bytes: bytes) -> None:
-    """Kick off incident report generation in a background thread."""
-    t = threading.Thread(
-        target=_generate_incident_report_bg,
-        args=(alert_id, frame_bytes),
-        daemon=True,
-    )
-    t.start()
+    """Queue incident report generation on the report pool (dropped if the queue is full)."""
+    if not _report_slots.acquire(blocking=False):
+        logger.warning("Auto-report queue full; skipping report for %s", alert_id)
+        return
+    fut = _report_executor.submit(_generate_incident_report_bg, alert_id, frame_bytes)
+    fut.add_done_callback(lambda _f: _report_slots.release())
 
 
 # ---------------------------------------------------------------------------
 # Feature 2 helper – zone check + logging
 # ---------------------------------------------------------------------------
 
-def _run_zone_check(
+def _compute_zone_alerts(
     contents: bytes,
     feed_id: int,
     faces: list[dict] | None = None,
+    bgr: np.ndarray | None = None,
+    persons: list[dict] | None = None,
 ) -> list[dict]:
     """
     Run zone crossing/presence check for this feed's active zones.
-    Logs unauthorized alerts (with cooldown) to the security log.
-    Returns the full list of zone_alert dicts for the API response.
+    Returns the full list of zone_alert dicts for the API response (no side effects).
+    Pass persons already detected on this frame to skip a second YOLO pass.
     """
     zones = get_zones_for_feed(_data_dir, feed_id)
     if not zones:
         return []
+    return check_zones(contents, feed_id, zones, faces, bgr=bgr, persons=persons)
 
-    zone_alerts = check_zones(contents, feed_id, zones, faces)
 
+def _handle_zone_alerts_bg(contents: bytes, feed_id: int, zone_alerts: list[dict]) -> None:
+    """Log, SMS and report unauthorized zone alerts (runs as a background task)."""
     for za in zone_alerts:
-        if not za.get("authorized") and should_log_alert(feed_id, za.get("zone_id", "")):
-            atype = za.get("alert_type", "zone_presence")
-            zname = za.get("zone_name", "unknown zone")
-            suffix = " – boundary line crossed" if atype == "line_crossing" else ""
-            alert = log_alert(
-                _data_dir,
-                alert_type=atype,
-                feed_id=feed_id,
-                person_name=za.get("person_name", "Unknown"),
-                person_role=za.get("person_role"),
-                authorized=False,
-                zone_name=za.get("zone_name"),
-                details=f"Unauthorized person detected in restricted zone '{zname}'{suffix}",
-            )
-            rec_url = _save_recording(alert["alert_id"], feed_id)
-            if rec_url:
-                from app.security_service import _load as _sload, _save as _ssave
-                saved = _sload(_data_dir)
-                for a in saved:
-                    if a.get("alert_id") == alert["alert_id"]:
-                        a["recording_url"] = rec_url
-                        break
-                _ssave(_data_dir, saved)
-
-            # SMS alert: unauthorized person in restricted zone → Twilio SMS
-            send_zone_alert_sms(
-                zone_name=zname,
-                alert_type=atype,
-                person_name=za.get("person_name", "Unknown"),
-                details=f"Unauthorized person detected in restricted zone '{zname}'{suffix}",
-            )
+        atype = za.get("alert_type", "zone_presence")
+        zname = za.get("zone_name", "unknown zone")
+        suffix = " – boundary line crossed" if atype == "line_crossing" else ""
+        alert_id = new_alert_id()
+        frames = _snapshot_frames(feed_id)
+        alert = log_alert(
+            _data_dir,
+            alert_type=atype,
+            feed_id=feed_id,
+            person_name=za.get("person_name", "Unknown"),
+            person_role=za.get("person_role"),
+            authorized=False,
+            zone_name=za.get("zone_name"),
+            details=f"Unauthorized person detected in restricted zone '{zname}'{suffix}",
+            recording_url=_recording_url(alert_id, frames),
+            alert_id=alert_id,
+        )
+        _save_recording(alert_id, frames)
+
+        # SMS alert: unauthorized person in restricted zone → Twilio SMS
+        send_zone_alert_sms(
+            zone_name=zname,
+            alert_type=atype,
+            person_name=za.get("person_name", "Unknown"),
+            details=f"Unauthorized person detected in restricted zone '{zname}'{suffix}",
+        )
+
+        # Auto-generate incident report (Nemotron VLM → Claude → PDF)
+        _auto_generate_report(alert["alert_id"], contents)
+
+
+def _schedule_zone_alerts(
+    background_tasks: BackgroundTasks,
+    contents: bytes,
+    feed_id: int,
+    zone_alerts: list[dict],
+) -> None:
+    """Apply the per-zone cooldown inline, then defer logging/SMS/report until after the response."""
+    to_log = [
+        za for za in zone_alerts
+        if not za.get("authorized") and should_log_alert(feed_id, za.get("zone_id", ""))
+    ]
+    if to_log:
+        background_tasks.add_task(_handle_zone_alerts_bg, contents, feed_id, to_log)
+
 
-            # Auto-generate incident report (Nemotron VLM → Claude → PDF)
-            _auto_generate_report(alert["alert_id"], contents)
+# ---------------------------------------------------------------------------
+# Serialized list responses, keyed by the backing store's version. Polled GETs
+# return the cached bytes instead of rebuilding and re-validating the model graph.
+# ---------------------------------------------------------------------------
+# Keys can carry request parameters (alert limit, feed id), so the cache is a bounded LRU.
+_RESPONSE_CACHE_MAX = 64
+_response_cache: OrderedDict[Hashable, tuple[Hashable, bytes]] = OrderedDict()
 
-    return zone_alerts
+
+def _cached_json(key: Hashable, version: Hashable, build: Callable[[], BaseModel | dict]) -> Response:
+    hit = _response_cache.get(key)
+    if hit is None or hit[0] != version:
+        payload = build()
+        body = payload.model_dump_json().encode() if isinstance(payload, BaseModel) else orjson.dumps(payload)
+        hit = (version, body)
+        _response_cache[key] = hit
+        if len(_response_cache) > _RESPONSE_CACHE_MAX:
+            _response_cache.popitem(last=False)
+    _response_cache.move_to_end(key)
+    return Response(content=hit[1], media_type="application/json")
 
 
 # ===========================================================================
@@ -426,13 +761,13 @@ async def register_face(
     file: UploadFile = File(...),
 ):
     """Register a face from an uploaded image. Uses first/largest face found."""
-    if not file.content_type or not file.content_type.startswith("image/"):
-        raise HTTPException(400, "File must be an image")
     try:
         contents = await file.read()
     except Exception as e:
         logger.exception("Failed to read upload")
         raise HTTPException(400, f"Failed to read image: {e!s}")
+    if _sniff_image(contents) is None:
+        raise HTTPException(400, "File must be a PNG, JPEG or WebP image")
     try:
         svc = get_face_service()
         identity_id, message = svc.register(contents, name, role=role or "Visitor")
@@ -452,56 +787,77 @@ async def register_face(
 
 @app.post("/api/recognize", response_model=RecognizeResponse)
 async def recognize_face(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     feed_id: int = Form(None),
 ):
     """Detect faces + check camera zones. feed_id required for zone enforcement."""
-    if not file.content_type or not file.content_type.startswith("image/"):
-        raise HTTPException(400, "File must be an image")
     try:
         contents = await file.read()
     except Exception as e:
         logger.exception("Failed to read upload")
         raise HTTPException(400, f"Failed to read image: {e!s}")
+    if _sniff_image(contents) is None:
+        raise HTTPException(400, "File must be a PNG, JPEG or WebP image")
+    digest = _frame_digest(contents)
+    if feed_id is not None:
+        cached = _cached_frame_response("recognize", int(feed_id), digest)
+        if cached is not None:
+            return ORJSONResponse(cached)
+    frame = _decode_frame(contents)
+    if frame is None:
+        raise HTTPException(400, "Could not decode image")
     if feed_id is not None:
         _buffer_frame(int(feed_id), contents)
+    async with _feed_lock(int(feed_id)) if feed_id is not None else nullcontext():
+        try:
+            face_dicts = await _face_batcher.submit(frame, key=int(feed_id) if feed_id is not None else None)
+        except ValueError as e:
+            raise HTTPException(400, str(e))
+        except Exception as e:
+            logger.exception("Recognize failed")
+            raise HTTPException(503, detail=f"Recognition failed: {e!s}")
 
-    try:
-        svc = get_face_service()
-        raw_detections = svc.recognize(contents)
-        face_dicts = [d if isinstance(d, dict) else d.model_dump() for d in raw_detections]
-    except ValueError as e:
-        raise HTTPException(400, str(e))
-    except Exception as e:
-        logger.exception("Recognize failed")
-        raise HTTPException(503, detail=f"Recognition failed: {e!s}")
+        # Body tracking: detect person bboxes and lock identity to body so we keep
+        # showing who someone is even when their face is no longer in frame.
+        dicts = face_dicts
+        persons = None
+        if feed_id is not None:
+            try:
+                persons = await _person_batcher.submit(frame, key=int(feed_id))
+                person_bboxes = [p["bbox"] for p in persons]
+                if person_bboxes:
+                    dicts = body_tracker.update(int(feed_id), person_bboxes, face_dicts)
+            except Exception as e:
+                logger.warning("Body tracking failed: %s", e)
+
+        # Door service + zone attribution use raw face_dicts (single-frame, immediate identity).
+        # The live-video overlay uses `dicts` (body-tracked, debounced, stable).
+        if feed_id is not None:
+            set_last_recognition(int(feed_id), face_dicts if face_dicts else dicts)
 
-    # Body tracking: detect person bboxes and lock identity to body so we keep
-    # showing who someone is even when their face is no longer in frame.
-    dicts = face_dicts
-    if feed_id is not None:
+        zone_alerts: list[dict] = []
         try:
-            person_bboxes = [p["bbox"] for p in detect_persons(contents)]
-            if person_bboxes:
-                dicts = body_tracker.update(int(feed_id), person_bboxes, face_dicts)
+            if feed_id is not None:
+                # Pass raw face detections so alert names are based on the current
+                # frame's recognised face, not the stricter body-tracker state.
+                async with _infer_sem:
+                    zone_alerts = await run_in_threadpool(
+                        _compute_zone_alerts,
+                        contents,
+                        int(feed_id),
+                        face_dicts if face_dicts else dicts,
+                        frame,
+                        persons,
+                    )
+                _schedule_zone_alerts(background_tasks, contents, int(feed_id), zone_alerts)
         except Exception as e:
-            logger.warning("Body tracking failed: %s", e)
-
-    # Door service + zone attribution use raw face_dicts (single-frame, immediate identity).
-    # The live-video overlay uses `dicts` (body-tracked, debounced, stable).
-    if feed_id is not None:
-        set_last_recognition(int(feed_id), face_dicts if face_dicts else dicts)
+            logger.warning("Zone check failed: %s", e)
 
-    zone_alerts: list[dict] = []
-    try:
+        payload = {"detections": dicts, "zone_alerts": zone_alerts}
         if feed_id is not None:
-            # Pass raw face detections so alert names are based on the current
-            # frame's recognised face, not the stricter body-tracker state.
-            zone_alerts = _run_zone_check(contents, int(feed_id), faces=face_dicts if face_dicts else dicts)
-    except Exception as e:
-        logger.warning("Zone check failed: %s", e)
-
-    return RecognizeResponse(detections=dicts, zone_alerts=zone_alerts)
+            _remember_frame_response("recognize", int(feed_id), digest, payload)
+    return ORJSONResponse(payload)
 
 
 @app.get("/api/health")
@@ -513,9 +869,11 @@ async def health():
 async def list_faces():
     try:
         svc = get_face_service()
-        raw = svc.list_faces()
-        faces = [FaceListItem(**f) for f in raw]
-        return FacesListResponse(faces=faces)
+        return _cached_json(
+            "faces",
+            svc.version,
+            lambda: FacesListResponse(faces=[FaceListItem(**f) for f in svc.list_faces()]),
+        )
     except Exception:
         return FacesListResponse(faces=[])
 
@@ -562,14 +920,20 @@ async def delete_face(identity_id: str):
 # Role endpoints
 # ===========================================================================
 
+_DEFAULT_ROLES_RESP = RolesListResponse(roles=["Visitor", "Analyst", "C-Level"])
+
+
 @app.get("/api/roles", response_model=RolesListResponse)
 async def list_roles():
     try:
         svc = get_face_service()
-        roles = svc.get_roles()
-        return RolesListResponse(roles=roles if roles else ["Visitor", "Analyst", "C-Level"])
+        return _cached_json(
+            "roles",
+            svc.version,
+            lambda: RolesListResponse(roles=svc.get_roles() or _DEFAULT_ROLES_RESP.roles),
+        )
     except Exception:
-        return RolesListResponse(roles=["Visitor", "Analyst", "C-Level"])
+        return _DEFAULT_ROLES_RESP
 
 
 @app.post("/api/roles")
@@ -600,19 +964,44 @@ async def delete_role(role_name: str):
 
 @app.post("/api/floorplan")
 async def upload_floorplan(file: UploadFile = File(...)):
-    if not file.content_type or not file.content_type.startswith("image/"):
-        raise HTTPException(400, "File must be an image")
-    contents = await file.read()
-    save_floorplan_image(_data_dir, contents)
+    head = await file.read(12)
+    if _sniff_image(head) is None:
+        raise HTTPException(400, "File must be a PNG, JPEG or WebP image")
+    await file.seek(0)
+    await run_in_threadpool(save_floorplan_fileobj, _data_dir, file.file)
     return {"ok": True}
 
 
+_IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+
+
+def _conditional_file_response(
+    request: Request,
+    path: Path,
+    media_type: str,
+    cache_control: str = "public, max-age=60",
+    not_found: str = "File not found",
+    filename: str | None = None,
+) -> Response:
+    """
+    FileResponse with an mtime/size ETag; answers If-None-Match with 304 (no disk read).
+    The single stat() doubles as the existence check and is handed to FileResponse.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        raise HTTPException(404, not_found)
+    etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type=media_type, headers=headers, stat_result=st, filename=filename)
+
+
 @app.get("/api/floorplan/image")
-async def get_floorplan_image():
+async def get_floorplan_image(request: Request):
     path = get_floorplan_path(_data_dir)
-    if not path.exists():
-        raise HTTPException(404, "No floor plan uploaded")
-    return FileResponse(path, media_type="image/png")
+    return _conditional_file_response(request, path, "image/png", not_found="No floor plan uploaded")
 
 
 @app.get("/api/floorplan")
@@ -622,14 +1011,17 @@ async def get_floorplan_status():
 
 @app.get("/api/floorplan/zones", response_model=ZonesListResponse)
 async def list_floorplan_zones():
-    zones = load_zones(_data_dir)
-    return ZonesListResponse(zones=[ZoneItem(**z) for z in zones])
+    return _cached_json(
+        "floorplan_zones",
+        zones_version(_data_dir),
+        lambda: ZonesListResponse(zones=[ZoneItem(**z) for z in load_zones(_data_dir)]),
+    )
 
 
 @app.post("/api/floorplan/zones", response_model=ZoneItem)
 async def create_floorplan_zone(body: CreateZoneBody):
     zone = add_zone(_data_dir, body.model_dump())
-    return ZoneItem(**zone)
+    return zone  # validated once against response_model
 
 
 @app.patch("/api/floorplan/zones/{zone_id}")
@@ -650,14 +1042,17 @@ async def delete_floorplan_zone(zone_id: str):
 
 @app.get("/api/floorplan/doors", response_model=DoorsListResponse)
 async def list_floorplan_doors():
-    doors = load_doors(_data_dir)
-    return DoorsListResponse(doors=[DoorItem(**d) for d in doors])
+    return _cached_json(
+        "floorplan_doors",
+        doors_version(_data_dir),
+        lambda: DoorsListResponse(doors=[DoorItem(**d) for d in load_doors(_data_dir)]),
+    )
 
 
 @app.post("/api/floorplan/doors", response_model=DoorItem)
 async def create_floorplan_door(body: CreateDoorBody):
     door = add_door(_data_dir, body.model_dump())
-    return DoorItem(**door)
+    return door  # validated once against response_model
 
 
 @app.patch("/api/floorplan/doors/{door_id}")
@@ -684,142 +1079,235 @@ _DEFAULT_DOOR_AREAS = [
     {"id": "office1", "name": "Office 1", "face_feed_id": 0, "door_feed_id": 1, "allowed_roles": ["C-Level"]},
     {"id": "office2", "name": "Office 2", "face_feed_id": 2, "door_feed_id": 3, "allowed_roles": ["Analyst", "C-Level"]},
 ]
+_DEFAULT_DOOR_AREAS_RESP = DoorAreasResponse(areas=[DoorAreaItem(**a) for a in _DEFAULT_DOOR_AREAS])
 
 
 @app.get("/api/door/areas", response_model=DoorAreasResponse)
 async def get_door_areas():
-    try:
-        areas = load_door_areas(_data_dir)
+    def build() -> DoorAreasResponse:
         out = []
-        for a in areas:
+        for a in load_door_areas(_data_dir):
             try:
                 out.append(DoorAreaItem(**a))
             except Exception:
                 pass
-        if not out:
-            out = [DoorAreaItem(**a) for a in _DEFAULT_DOOR_AREAS]
-        return DoorAreasResponse(areas=out)
+        return DoorAreasResponse(areas=out) if out else _DEFAULT_DOOR_AREAS_RESP
+
+    try:
+        return _cached_json("door_areas", door_areas_version(_data_dir), build)
     except Exception:
-        return DoorAreasResponse(areas=[DoorAreaItem(**a) for a in _DEFAULT_DOOR_AREAS])
+        return _DEFAULT_DOOR_AREAS_RESP
 
 
 @app.put("/api/door/areas", response_model=DoorAreasResponse)
 async def update_door_areas(body: DoorAreaUpdateBody):
-    areas = [a.model_dump() for a in body.areas]
-    for a in areas:
-        if "id" not in a or not a["id"]:
-            a["id"] = a.get("name", "").lower().replace(" ", "") or "area"
-    save_door_areas(_data_dir, areas)
-    return DoorAreasResponse(areas=[DoorAreaItem(**a) for a in areas])
+    # body.areas is already validated: stamp ids in place and return it as-is.
+    for a in body.areas:
+        if not a.id:
+            a.id = a.name.lower().replace(" ", "") or "area"
+    save_door_areas(_data_dir, [a.model_dump() for a in body.areas])
+    return DoorAreasResponse(areas=body.areas)
 
 
 @app.post("/api/door/detect", response_model=DoorDetectResponse)
 async def door_detect(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     feed_id: int = Form(0),
 ):
     """Run door detection + zone check on image. Feature 1 + Feature 2."""
-    if not file.content_type or not file.content_type.startswith("image/"):
-        raise HTTPException(400, "File must be an image")
     try:
         contents = await file.read()
     except Exception as e:
         raise HTTPException(400, f"Failed to read file: {e}") from e
+    if _sniff_image(contents) is None:
+        raise HTTPException(400, "File must be a PNG, JPEG or WebP image")
+
+    digest = _frame_digest(contents)
+    cached = _cached_frame_response("door", int(feed_id), digest)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
+    async with _feed_lock(int(feed_id)):
+        frame = _decode_frame(contents)
+        if frame is None:
+            raise HTTPException(400, "Could not decode image")
+        _buffer_frame(int(feed_id), contents)
 
-    _buffer_frame(int(feed_id), contents)
-
-    areas = load_door_areas(_data_dir)
-    door_config = get_door_by_feed_id(_data_dir, int(feed_id))
+        areas = load_door_areas(_data_dir)
+        door_config = get_door_by_feed_id(_data_dir, int(feed_id))
 
-    try:
-        result = detect_doors(contents, int(feed_id), areas, door_config=door_config)
-    except Exception:
-        from app.door_service import _safe_fallback
-        result = _safe_fallback(int(feed_id), door_config, areas)
+        if not has_door(int(feed_id), door_config, areas):
+            result = no_door_result()
+        else:
+            try:
+                async with _infer_sem:
+                    result = await run_in_threadpool(
+                        detect_doors, contents, int(feed_id), areas, door_config=door_config, bgr=frame
+                    )
+            except Exception:
+                from app.door_service import _safe_fallback
+                result = _safe_fallback(int(feed_id), door_config, areas)
 
-    # Feature 1: log unauthorized door alert
-    _maybe_log_door_alert(int(feed_id), result)
+        # Feature 1: log unauthorized door alert (after the response is sent)
+        if _door_alert_due(int(feed_id), result):
+            background_tasks.add_task(_log_door_alert, int(feed_id), result)
 
-    # Feature 2: zone check (no face detections available in this endpoint)
-    zone_alerts = _run_zone_check(contents, int(feed_id), faces=None)
+        # Feature 2: zone check (no face detections available in this endpoint)
+        async with _infer_sem:
+            zone_alerts = await run_in_threadpool(_compute_zone_alerts, contents, int(feed_id), None, frame)
+        _schedule_zone_alerts(background_tasks, contents, int(feed_id), zone_alerts)
 
-    return DoorDetectResponse(**result, zone_alerts=zone_alerts)
+        payload = {**result, "zone_alerts": zone_alerts}
+        _remember_frame_response("door", int(feed_id), digest, payload)
+    return ORJSONResponse(payload)
 
 
 @app.post("/api/feed/analyze", response_model=FeedAnalyzeResponse)
 async def feed_analyze(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     feed_id: int = Form(0),
 ):
     """Combined face + door analysis on same frame. Feature 1 + Feature 2."""
-    if not file.content_type or not file.content_type.startswith("image/"):
-        raise HTTPException(400, "File must be an image")
     try:
         contents = await file.read()
     except Exception as e:
         raise HTTPException(400, f"Failed to read file: {e}") from e
+    if _sniff_image(contents) is None:
+        raise HTTPException(400, "File must be a PNG, JPEG or WebP image")
+
+    digest = _frame_digest(contents)
+    cached = _cached_frame_response("analyze", int(feed_id), digest)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
+    async with _feed_lock(int(feed_id)):
+        # Decoded once, shared by every model below; large frames are analysed at <= 720p and
+        # all returned bboxes are mapped back to source pixels before responding.
+        frame = _decode_frame(contents)
+        if frame is None:
+            raise HTTPException(400, "Could not decode image")
+        _buffer_frame(int(feed_id), contents)
+        frame, scale = _downscale_frame(frame)
 
-    _buffer_frame(int(feed_id), contents)
-
-    svc = get_face_service()
-    areas = load_door_areas(_data_dir)
-    door_config = get_door_by_feed_id(_data_dir, int(feed_id))
-
-    try:
-        raw_detections = svc.recognize(contents)
-        face_dicts = [d if isinstance(d, dict) else d.model_dump() for d in raw_detections]
-    except ValueError:
-        face_dicts = []
-
-    # Body tracking
-    detections_dict = face_dicts
-    try:
-        person_bboxes = [p["bbox"] for p in detect_persons(contents)]
-        if person_bboxes:
-            detections_dict = body_tracker.update(int(feed_id), person_bboxes, face_dicts)
-    except Exception as e:
-        logger.warning("Body tracking failed: %s", e)
-
-    # Door + zone attribution use raw face_dicts; live overlay uses body-tracked detections_dict.
-    set_last_recognition(int(feed_id), face_dicts if face_dicts else detections_dict)
+        areas = load_door_areas(_data_dir)
+        door_config = get_door_by_feed_id(_data_dir, int(feed_id))
+        door_assigned = has_door(int(feed_id), door_config, areas)
+
+        # Static scene: reuse the last frame's faces/persons. Door detection still runs on door
+        # feeds because door movement is exactly the small change the hash tolerates.
+        ahash = _average_hash(frame)
+        reused = _reusable_frame_results(int(feed_id), ahash)
+
+        # Doors, faces and persons only share the input frame: run all three concurrently so
+        # the response waits for the slowest model rather than the sum of them.
+        # Feeds without a door never touch the door detector.
+        jobs = []
+        if door_assigned:
+            jobs.append(
+                _limited_inference(detect_doors, contents, int(feed_id), areas, door_config=door_config, bgr=frame)
+            )
+        if reused is None:
+            jobs.append(_face_batcher.submit(frame, key=int(feed_id)))
+            if _needs_persons(int(feed_id), door_config):
+                jobs.append(_person_batcher.submit(frame, key=int(feed_id)))
+        model_out = []
+        if jobs:
+            model_out = await asyncio.gather(*jobs, return_exceptions=True)
+        door_result = model_out.pop(0) if door_assigned else no_door_result()
+        if reused is None:
+            raw_detections, persons = model_out[0], (model_out[1] if len(model_out) > 1 else [])
+        else:
+            raw_detections, persons = reused
+        if isinstance(raw_detections, ValueError):
+            face_dicts = []
+        elif isinstance(raw_detections, BaseException):
+            raise raw_detections
+        else:
+            face_dicts = raw_detections  # FaceService.recognize always returns list[dict]
+        if reused is None and face_dicts:
+            _feeds_with_faces.add(int(feed_id))
+        elif reused is None:
+            _feeds_with_faces.discard(int(feed_id))
+        if isinstance(persons, BaseException):
+            logger.warning("Person detection failed: %s", persons)
+            persons = []
+        elif reused is None:
+            if ahash is not None:
+                _last_hash[int(feed_id)] = (ahash, time.monotonic(), face_dicts, persons)
+            _idle_streak[int(feed_id)] = 0 if (persons or face_dicts) else _idle_streak.get(int(feed_id), 0) + 1
+
+        # Body tracking
+        detections_dict = face_dicts
+        try:
+            person_bboxes = [p["bbox"] for p in persons]
+            if person_bboxes:
+                detections_dict = body_tracker.update(int(feed_id), person_bboxes, face_dicts)
+        except Exception as e:
+            logger.warning("Body tracking failed: %s", e)
 
-    try:
-        door_result = detect_doors(contents, int(feed_id), areas, door_config=door_config)
-    except Exception:
-        from app.door_service import _safe_fallback
-        door_result = _safe_fallback(int(feed_id), door_config, areas)
-
-    # Feature 1: log unauthorized door alert
-    _maybe_log_door_alert(int(feed_id), door_result)
-
-    # Zone attribution uses raw face_dicts (immediate, single-frame identity).
-    zone_alerts = _run_zone_check(contents, int(feed_id), faces=face_dicts if face_dicts else detections_dict)
-
-    return FeedAnalyzeResponse(
-        detections=detections_dict,
-        doors=door_result.get("doors", []),
-        movement_detected=door_result.get("movement_detected", False),
-        area_name=door_result.get("area_name"),
-        last_person=door_result.get("last_person"),
-        allowed=door_result.get("allowed", True),
-        alert=door_result.get("alert", False),
-        hint=door_result.get("hint"),
-        zone_alerts=zone_alerts,
-    )
+        # Door + zone attribution use raw face_dicts; live overlay uses body-tracked detections_dict.
+        set_last_recognition(int(feed_id), face_dicts if face_dicts else detections_dict)
+
+        if isinstance(door_result, BaseException):
+            from app.door_service import _safe_fallback
+            door_result = _safe_fallback(int(feed_id), door_config, areas)
+        elif door_assigned:
+            # detect_doors ran before this frame's recognition was stored; re-attribute the person.
+            door_result = refresh_door_access(door_result, int(feed_id), areas, door_config=door_config)
+
+        # Feature 1: log unauthorized door alert (after the response is sent)
+        if _door_alert_due(int(feed_id), door_result):
+            background_tasks.add_task(_log_door_alert, int(feed_id), door_result)
+
+        # Zone attribution uses raw face_dicts (immediate, single-frame identity).
+        async with _infer_sem:
+            zone_alerts = await run_in_threadpool(
+                _compute_zone_alerts,
+                contents,
+                int(feed_id),
+                face_dicts if face_dicts else detections_dict,
+                frame,
+                persons,
+            )
+        inv = 1.0 / scale
+        zone_alerts = _rescale_bboxes(zone_alerts, inv, key="person_bbox")
+        _schedule_zone_alerts(background_tasks, contents, int(feed_id), zone_alerts)
+
+        payload = {
+            "detections": _rescale_bboxes(detections_dict, inv),
+            "doors": _rescale_bboxes(door_result.get("doors", []), inv),
+            "movement_detected": door_result.get("movement_detected", False),
+            "area_name": door_result.get("area_name"),
+            "last_person": door_result.get("last_person"),
+            "allowed": door_result.get("allowed", True),
+            "alert": door_result.get("alert", False),
+            "hint": door_result.get("hint"),
+            "zone_alerts": zone_alerts,
+        }
+        _remember_frame_response("analyze", int(feed_id), digest, payload)
+    return ORJSONResponse(payload)
 
 
 # ===========================================================================
 # Security alerts endpoints  (Feature 1 + 2 log)
 # ===========================================================================
 
+_ALERT_FIELDS = tuple(SecurityAlert.model_fields)
+
+
 @app.get("/api/security/alerts", response_model=AlertsListResponse)
-async def list_security_alerts(limit: int = 200):
+async def list_security_alerts(limit: int = Query(200, ge=1, le=MAX_ALERTS)):
     """Return recent security alerts, newest first."""
-    alerts = get_alerts(_data_dir, limit=limit)
-    # Ensure resolution key exists for older alerts
-    for a in alerts:
-        a.setdefault("resolution", None)
-    return AlertsListResponse(alerts=[SecurityAlert(**a) for a in alerts])
+
+    def build() -> dict:
+        # Alerts come from our own log: project them onto the SecurityAlert fields (older
+        # alerts lack resolution/recording_url) instead of re-validating every entry.
+        alerts = get_alerts(_data_dir, limit=limit)
+        return {"alerts": [{k: a.get(k) for k in _ALERT_FIELDS} for a in alerts]}
+
+    return _cached_json(("alerts", limit), alerts_version(_data_dir), build)
 
 
 @app.delete("/api/security/alerts")
@@ -860,18 +1348,22 @@ async def resolve_security_alert(alert_id: str, body: ResolveAlertBody):
 @app.get("/api/camera-zones", response_model=CameraZonesListResponse)
 async def list_camera_zones(feed_id: int | None = None):
     """List camera-view zones. Optionally filter by feed_id."""
-    if feed_id is not None:
-        zones = get_zones_for_feed(_data_dir, feed_id)
-    else:
-        zones = load_camera_zones(_data_dir)
-    return CameraZonesListResponse(zones=[CameraZone(**z) for z in zones])
+
+    def build() -> CameraZonesListResponse:
+        if feed_id is not None:
+            zones = get_zones_for_feed(_data_dir, feed_id)
+        else:
+            zones = load_camera_zones(_data_dir)
+        return CameraZonesListResponse(zones=[CameraZone(**z) for z in zones])
+
+    return _cached_json(("camera_zones", feed_id), camera_zones_version(_data_dir), build)
 
 
 @app.post("/api/camera-zones", response_model=CameraZone)
 async def create_camera_zone(body: CreateCameraZoneBody):
     """Create a new camera-view zone (polygon or boundary line)."""
     zone = add_camera_zone(_data_dir, body.model_dump())
-    return CameraZone(**zone)
+    return zone  # validated once against response_model
 
 
 @app.patch("/api/camera-zones/{zone_id}", response_model=CameraZone)
@@ -881,7 +1373,7 @@ async def update_camera_zone_endpoint(zone_id: str, body: UpdateCameraZoneBody):
     updated = update_camera_zone(_data_dir, zone_id, updates)
     if updated is None:
         raise HTTPException(404, "Camera zone not found")
-    return CameraZone(**updated)
+    return updated  # validated once against response_model
 
 
 @app.delete("/api/camera-zones/{zone_id}")
@@ -896,42 +1388,34 @@ async def delete_camera_zone_endpoint(zone_id: str):
 # Report generation: Nemotron VLM + Claude + ReportLab PDF
 # ===========================================================================
 
-@app.post("/api/security/alerts/{alert_id}/generate-report")
-async def generate_security_report(alert_id: str):
-    """
-    Run Nemotron VLM analysis on the incident frame, write a formal report
-    with Claude, and return a styled PDF for download.
-    """
+def _gif_middle_frame_jpeg(gif_path: Path) -> bytes | None:
+    """JPEG of a recording's middle frame; seeks straight to it instead of converting every frame."""
+    try:
+        from PIL import Image as _PILImg
+        with _PILImg.open(gif_path) as gif:
+            gif.seek(getattr(gif, "n_frames", 1) // 2)
+            rgb = np.asarray(gif.convert("RGB"))
+        # OpenCV's bundled libjpeg-turbo encodes with SIMD; noticeably faster than PIL's JPEG save.
+        ok, enc = cv2.imencode(".jpg", cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR), [cv2.IMWRITE_JPEG_QUALITY, 88])
+        return enc.tobytes() if ok else None
+    except Exception as e:
+        logger.warning("Could not load frame from GIF: %s", e)
+        return None
+
+
+async def _build_security_report(alert_id: str) -> bytes:
+    """Nemotron frame analysis → Claude write-up → PDF bytes for one alert."""
     from app.ai_analysis_service import analyze_frame_with_nemotron, write_report_with_claude
-    from app.report_service import generate_pdf_report
-    import asyncio, functools
+    import functools
 
-    alerts = get_alerts(_data_dir, limit=500)
-    alert = next((a for a in alerts if a.get("alert_id") == alert_id), None)
+    alert = get_alert(_data_dir, alert_id)
     if not alert:
         raise HTTPException(404, "Alert not found")
 
     # Load frame bytes: extract first frame from GIF recording
+    await run_in_threadpool(_wait_for_recording, alert_id)
     gif_path = _data_dir / "recordings" / f"{alert_id}.gif"
-    frame_bytes: bytes | None = None
-    if gif_path.exists():
-        try:
-            from PIL import Image as _PILImg
-            gif = _PILImg.open(gif_path)
-            mid_frame = gif
-            try:
-                frames = []
-                while True:
-                    frames.append(gif.copy().convert("RGB"))
-                    gif.seek(gif.tell() + 1)
-                mid_frame = frames[len(frames) // 2] if frames else gif
-            except EOFError:
-                pass
-            buf = io.BytesIO()
-            mid_frame.save(buf, format="JPEG", quality=88)
-            frame_bytes = buf.getvalue()
-        except Exception as e:
-            logger.warning("Could not load frame from GIF: %s", e)
+    frame_bytes = await run_in_threadpool(_gif_middle_frame_jpeg, gif_path) if gif_path.exists() else None
 
     loop = asyncio.get_event_loop()
 
@@ -952,15 +1436,36 @@ async def generate_security_report(alert_id: str):
         None,
         functools.partial(write_report_with_claude, alert, nemotron),
     )
-    pdf_bytes = await loop.run_in_executor(
-        None,
-        functools.partial(generate_pdf_report, alert, nemotron, report_text, _data_dir),
-    )
+    return await run_in_threadpool(_render_pdf, alert, nemotron, report_text)
+
+
+# alert_id → in-flight report build; a second click on the same alert awaits the first.
+_inflight_reports: dict[str, asyncio.Task] = {}
 
+
+@app.post("/api/security/alerts/{alert_id}/generate-report")
+async def generate_security_report(alert_id: str):
+    """
+    Run Nemotron VLM analysis on the incident frame, write a formal report
+    with Claude, and return a styled PDF for download.
+    An already-generated (auto) report for the alert is returned as-is.
+    """
     short_id = alert_id[:8].upper()
     filename = f"HOF-Security-Report-{short_id}.pdf"
-    from fastapi.responses import Response as _Resp
-    return _Resp(
+
+    existing = _data_dir / "incident_reports" / f"{alert_id}.pdf"
+    if existing.exists():
+        return FileResponse(existing, media_type="application/pdf", filename=filename)
+
+    task = _inflight_reports.get(alert_id)
+    if task is None:
+        task = asyncio.ensure_future(_build_security_report(alert_id))
+        _inflight_reports[alert_id] = task
+        task.add_done_callback(lambda _t: _inflight_reports.pop(alert_id, None))
+    # shield: one caller disconnecting must not cancel the build the others are waiting on
+    pdf_bytes = await asyncio.shield(task)
+
+    return Response(
         content=pdf_bytes,
         media_type="application/pdf",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
@@ -972,50 +1477,82 @@ async def generate_security_report(alert_id: str):
 # ===========================================================================
 
 @app.get("/api/security/recordings/{alert_id}")
-async def get_recording(alert_id: str):
+async def get_recording(alert_id: str, request: Request):
     """Serve the animated GIF recording attached to a security alert."""
+    await run_in_threadpool(_wait_for_recording, alert_id)
     path = _data_dir / "recordings" / f"{alert_id}.gif"
-    if not path.exists():
-        raise HTTPException(404, "Recording not found")
-    return FileResponse(str(path), media_type="image/gif")
+    # One GIF per alert id, written once: let browsers cache it for good.
+    return _conditional_file_response(request, path, "image/gif", _IMMUTABLE_CACHE, "Recording not found")
 
 
 @app.get("/api/security/reports/{alert_id}")
-async def get_incident_report(alert_id: str):
+async def get_incident_report(alert_id: str, request: Request):
     """Serve the auto-generated PDF incident report."""
     path = _data_dir / "incident_reports" / f"{alert_id}.pdf"
-    if not path.exists():
-        raise HTTPException(404, "Incident report not yet generated")
     short_id = alert_id[:8].upper()
-    return FileResponse(
-        str(path),
-        media_type="application/pdf",
+    return _conditional_file_response(
+        request,
+        path,
+        "application/pdf",
+        not_found="Incident report not yet generated",
         filename=f"HOF-Security-Report-{short_id}.pdf",
     )
 
 
 @app.get("/api/security/alerts/{alert_id}/audio")
-async def get_alert_audio(alert_id: str):
+async def get_alert_audio(alert_id: str, request: Request):
     """Serve the ElevenLabs TTS audio announcement for a security alert."""
     path = _data_dir / "alert_audio" / f"{alert_id}.mp3"
-    if not path.exists():
-        raise HTTPException(404, "Audio not yet generated")
-    return FileResponse(str(path), media_type="audio/mpeg")
+    return _conditional_file_response(request, path, "audio/mpeg", not_found="Audio not yet generated")
 
 
 @app.get("/api/security/reports/{alert_id}/image")
-async def get_threat_image(alert_id: str):
+async def get_threat_image(alert_id: str, request: Request):
     """Serve the threat image captured at the time of the alert."""
     path = _data_dir / "incident_reports" / f"{alert_id}_threat.jpg"
-    if not path.exists():
-        raise HTTPException(404, "Threat image not found")
-    return FileResponse(str(path), media_type="image/jpeg")
+    return _conditional_file_response(request, path, "image/jpeg", not_found="Threat image not found")
 
 
 # ===========================================================================
 # Static frontend (production build)
 # ===========================================================================
 
+class _FrontendFiles(StaticFiles):
+    """
+    StaticFiles for the Vite build: serves a precompressed sibling (app.js.br / app.js.gz,
+    e.g. from `brotli -k` / `gzip -k` over dist/) when the client accepts it, and marks the
+    content-hashed files under assets/ as immutable.
+    """
+
+    _ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+    async def get_response(self, path: str, scope) -> Response:
+        request_headers = Headers(scope=scope)
+        accept = request_headers.get("accept-encoding", "")
+        response = None
+        if Path(path).suffix:
+            for encoding, ext in self._ENCODINGS:
+                if encoding not in accept:
+                    continue
+                full_path, st = await run_in_threadpool(self.lookup_path, path + ext)
+                if st is None or not stat.S_ISREG(st.st_mode):
+                    continue
+                response = FileResponse(
+                    full_path,
+                    stat_result=st,
+                    media_type=mimetypes.guess_type(path)[0] or "application/octet-stream",
+                    headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+                )
+                if self.is_not_modified(response.headers, request_headers):
+                    response = NotModifiedResponse(response.headers)
+                break
+        if response is None:
+            response = await super().get_response(path, scope)
+        if Path(path).parts[:1] == ("assets",) and response.status_code in (200, 304):
+            response.headers["Cache-Control"] = _IMMUTABLE_CACHE
+        return response
+
+
 _frontend_dist = Path(__file__).resolve().parent.parent.parent / "frontend" / "dist"
 if _frontend_dist.exists():
-    app.mount("/", StaticFiles(directory=str(_frontend_dist), html=True), name="static")
+    app.mount("/", _FrontendFiles(directory=str(_frontend_dist), html=True), name="static")
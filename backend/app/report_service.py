@@ -13,12 +13,14 @@ Layout:
 """
 from __future__ import annotations
 
+import functools
 import io
 import logging
+import re
 import textwrap
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import IO, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +35,7 @@ try:
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
     from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
     from reportlab.platypus import (
-        SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
+        BaseDocTemplate, Frame, PageTemplate, Paragraph, Spacer, Table, TableStyle,
         HRFlowable, Image as RLImage, KeepTogether,
     )
     from reportlab.platypus.flowables import HRFlowable
@@ -50,37 +52,97 @@ HOF_AMBER  = HexColor("#f59e0b") if REPORTLAB_AVAILABLE else None
 HOF_SLATE  = HexColor("#475569") if REPORTLAB_AVAILABLE else None
 HOF_LIGHT  = HexColor("#f1f5f9") if REPORTLAB_AVAILABLE else None
 HOF_TEXT   = HexColor("#1e293b") if REPORTLAB_AVAILABLE else None
+HOF_MUTED  = HexColor("#94a3b8") if REPORTLAB_AVAILABLE else None
+HOF_GREEN  = HexColor("#22c55e") if REPORTLAB_AVAILABLE else None
+HOF_BORDER = HexColor("#cbd5e1") if REPORTLAB_AVAILABLE else None
+HOF_LINE   = HexColor("#e2e8f0") if REPORTLAB_AVAILABLE else None
+HOF_ROWALT = HexColor("#f8fafc") if REPORTLAB_AVAILABLE else None
+
+# Table styles shared by every report (Table.setStyle only reads the commands).
+if REPORTLAB_AVAILABLE:
+    _BANNER_STYLE = TableStyle([
+        ("BACKGROUND", (0, 0), (-1, -1), HOF_DARK),
+        ("TOPPADDING",    (0, 0), (-1, -1), 5),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
+        ("LEFTPADDING",   (0, 0), (-1, -1), 10),
+        ("RIGHTPADDING",  (0, 0), (-1, -1), 10),
+    ])
+    _BRAND_STYLE = TableStyle([
+        ("VALIGN",        (0, 0), (-1, -1), "MIDDLE"),
+        ("TOPPADDING",    (0, 0), (-1, -1), 2),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
+        ("LEFTPADDING",   (0, 0), (-1, -1), 0),
+        ("RIGHTPADDING",  (0, 0), (-1, -1), 0),
+    ])
+    _HEADER_STYLE = TableStyle([
+        ("BACKGROUND",    (0, 0), (-1, -1), HOF_DARK),
+        ("TOPPADDING",    (0, 0), (-1, -1), 16),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 16),
+        ("LEFTPADDING",   (0, 0), (-1, -1), 14),
+        ("RIGHTPADDING",  (0, 0), (-1, -1), 14),
+        ("VALIGN",        (0, 0), (-1, -1), "MIDDLE"),
+    ])
+    _META_STYLE = TableStyle([
+        ("BACKGROUND",    (0, 0), (-1, -1), HOF_LIGHT),
+        ("TOPPADDING",    (0, 0), (-1, -1), 5),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
+        ("LEFTPADDING",   (0, 0), (-1, -1), 8),
+        ("RIGHTPADDING",  (0, 0), (-1, -1), 8),
+        ("GRID",          (0, 0), (-1, -1), 0.3, HOF_BORDER),
+        ("VALIGN",        (0, 0), (-1, -1), "TOP"),
+    ])
+    _FIELDS_STYLE = TableStyle([
+        ("TOPPADDING",    (0, 0), (-1, -1), 4),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+        ("LEFTPADDING",   (0, 0), (-1, -1), 6),
+        ("RIGHTPADDING",  (0, 0), (-1, -1), 6),
+        ("ROWBACKGROUNDS", (0, 0), (-1, -1), [HOF_ROWALT, white]),
+        ("LINEBELOW", (0, 0), (-1, -2), 0.25, HOF_LINE),
+        ("VALIGN",    (0, 0), (-1, -1), "TOP"),
+    ])
+    _FIGURE_STYLE = TableStyle([
+        ("ALIGN",         (0, 0), (-1, -1), "CENTER"),
+        ("BACKGROUND",    (0, 0), (0, 0), HOF_DARK),
+        ("TOPPADDING",    (0, 0), (0, 0), 8),
+        ("BOTTOMPADDING", (0, 0), (0, 0), 8),
+        ("LEFTPADDING",   (0, 0), (-1, -1), 0),
+        ("RIGHTPADDING",  (0, 0), (-1, -1), 0),
+    ])
+
+
+# Section headings in the written report: ALL CAPS (at least one letter), 4+ chars, no
+# trailing period. A regex match stops at the first lowercase char of a body line.
+_HEADING_RE = re.compile(r"^(?=[^A-Z]*[A-Z])[A-Z0-9 \-/&,:;()'#.]{4,}(?<!\.)$")
 
 
-def _extract_gif_frame(gif_path: Path) -> Optional[bytes]:
-    """Extract the middle frame of the GIF recording as JPEG bytes."""
+def _extract_gif_frame(gif_path: Path) -> Optional[tuple[bytes, tuple[int, int]]]:
+    """Extract the middle frame of the GIF recording as (JPEG bytes, (width, height))."""
     try:
         from PIL import Image
-        img = Image.open(gif_path)
-        frames = []
-        try:
-            while True:
-                frames.append(img.copy().convert("RGB"))
-                img.seek(img.tell() + 1)
-        except EOFError:
-            pass
-        if not frames:
-            return None
-        mid = frames[len(frames) // 2]
-        # Scale up slightly so it looks better in the PDF
+        with Image.open(gif_path) as img:
+            # Seek straight to the middle frame; only that one gets decoded and converted.
+            try:
+                img.seek(getattr(img, "n_frames", 1) // 2)
+            except EOFError:
+                img.seek(0)
+            mid = img.convert("RGB")
+        # Scale up very small frames so they look better in the PDF. Bilinear is plenty for an
+        # upscale; ReportLab scales anything >= 320 px wide at draw time anyway.
         w, h = mid.size
-        if w < 400:
+        if w < 320:
             scale = 400 / w
-            mid = mid.resize((int(w * scale), int(h * scale)), Image.LANCZOS)
+            mid = mid.resize((int(w * scale), int(h * scale)), Image.BILINEAR)
         buf = io.BytesIO()
-        mid.save(buf, format="JPEG", quality=88)
-        return buf.getvalue()
+        mid.save(buf, format="JPEG", quality=85, optimize=False, progressive=False)
+        return buf.getvalue(), mid.size
     except Exception as e:
         logger.warning("Could not extract GIF frame: %s", e)
         return None
 
 
+@functools.lru_cache(maxsize=1)
 def _build_styles():
+    """Paragraph styles for the report, built once per process (read-only once built)."""
     base = getSampleStyleSheet()
     styles = {}
 
@@ -97,7 +159,7 @@ def _build_styles():
         "title_sub",
         fontName="Helvetica",
         fontSize=10,
-        textColor=HexColor("#94a3b8"),
+        textColor=HOF_MUTED,
         spaceAfter=0,
         leading=14,
         letterSpacing=2,
@@ -115,7 +177,7 @@ def _build_styles():
         "company_sub",
         fontName="Helvetica",
         fontSize=9,
-        textColor=HexColor("#94a3b8"),
+        textColor=HOF_MUTED,
         spaceAfter=0,
         leading=12,
         alignment=TA_RIGHT,
@@ -217,6 +279,26 @@ def _build_styles():
     return styles
 
 
+def _new_doc(buf, margin: float) -> "BaseDocTemplate":
+    """A4 document with one full-page frame (what SimpleDocTemplate sets up, without its build hooks)."""
+    doc = BaseDocTemplate(
+        buf,
+        pagesize=A4,
+        leftMargin=margin,
+        rightMargin=margin,
+        topMargin=margin,
+        bottomMargin=margin,
+        title="HOF Capital Security Incident Report",
+        author="LockDown Security System",
+        # Pinned rather than inherited from rl_config: the Claude write-up makes text-heavy pages.
+        pageCompression=1,
+        invariant=0,
+    )
+    frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id="normal")
+    doc.addPageTemplates([PageTemplate(id="main", frames=[frame])])
+    return doc
+
+
 def _hr(color=None, thickness=0.5):
     return HRFlowable(
         width="100%",
@@ -231,13 +313,7 @@ def _section_banner(text: str, styles: dict):
     """Dark banner row with white text — used as section headers."""
     cell = Paragraph(text, styles["section_head"])
     tbl = Table([[cell]], colWidths=["100%"])
-    tbl.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (-1, -1), HOF_DARK),
-        ("TOPPADDING",    (0, 0), (-1, -1), 5),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
-        ("LEFTPADDING",   (0, 0), (-1, -1), 10),
-        ("RIGHTPADDING",  (0, 0), (-1, -1), 10),
-    ]))
+    tbl.setStyle(_BANNER_STYLE)
     return tbl
 
 
@@ -247,14 +323,16 @@ def generate_pdf_report(
     report_text: str,
     data_dir: Path,
     escalation: dict | None = None,
-) -> bytes:
+    out: IO[bytes] | None = None,
+) -> bytes | None:
     """
-    Build and return the PDF as bytes.
+    Build and return the PDF as bytes, or write it into `out` and return None.
     alert        – the security alert dict
     nemotron     – result from analyze_frame_with_nemotron()
     escalation   – result from escalate_with_nemotron_super() (optional)
     report_text  – full written report from write_report_with_claude()
     data_dir     – backend data directory (to locate the GIF recording)
+    out          – writable binary stream (e.g. an open file) to render into without a copy
     """
     if not REPORTLAB_AVAILABLE:
         raise RuntimeError("reportlab is not installed. Run: pip install reportlab")
@@ -266,17 +344,8 @@ def generate_pdf_report(
     MARGIN = 1.8 * cm
     CONTENT_W = PAGE_W - 2 * MARGIN
 
-    buf = io.BytesIO()
-    doc = SimpleDocTemplate(
-        buf,
-        pagesize=A4,
-        leftMargin=MARGIN,
-        rightMargin=MARGIN,
-        topMargin=MARGIN,
-        bottomMargin=MARGIN,
-        title="HOF Capital Security Incident Report",
-        author="LockDown Security System",
-    )
+    buf = out if out is not None else io.BytesIO()
+    doc = _new_doc(buf, MARGIN)
 
     story = []
 
@@ -288,51 +357,29 @@ def generate_pdf_report(
          [Paragraph("SECURITY INCIDENT REPORT", styles["title_sub"])]],
         colWidths=[CONTENT_W * 0.42],
     )
-    brand_left.setStyle(TableStyle([
-        ("VALIGN",        (0, 0), (-1, -1), "MIDDLE"),
-        ("TOPPADDING",    (0, 0), (-1, -1), 2),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
-        ("LEFTPADDING",   (0, 0), (-1, -1), 0),
-        ("RIGHTPADDING",  (0, 0), (-1, -1), 0),
-    ]))
+    brand_left.setStyle(_BRAND_STYLE)
 
     brand_right = Table(
         [[Paragraph("HOF CAPITAL MANAGEMENT", styles["company"])],
          [Paragraph("Confidential — Internal Use Only", styles["company_sub"])]],
         colWidths=[CONTENT_W * 0.58],
     )
-    brand_right.setStyle(TableStyle([
-        ("VALIGN",        (0, 0), (-1, -1), "MIDDLE"),
-        ("TOPPADDING",    (0, 0), (-1, -1), 2),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
-        ("LEFTPADDING",   (0, 0), (-1, -1), 0),
-        ("RIGHTPADDING",  (0, 0), (-1, -1), 0),
-    ]))
+    brand_right.setStyle(_BRAND_STYLE)
 
     header_row = Table(
         [[brand_left, brand_right]],
         colWidths=[CONTENT_W * 0.42, CONTENT_W * 0.58],
     )
-    header_row.setStyle(TableStyle([
-        ("BACKGROUND",    (0, 0), (-1, -1), HOF_DARK),
-        ("TOPPADDING",    (0, 0), (-1, -1), 16),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 16),
-        ("LEFTPADDING",   (0, 0), (-1, -1), 14),
-        ("RIGHTPADDING",  (0, 0), (-1, -1), 14),
-        ("VALIGN",        (0, 0), (-1, -1), "MIDDLE"),
-    ]))
-    story.append(header_row)
-    story.append(Spacer(1, 0.3 * cm))
+    header_row.setStyle(_HEADER_STYLE)
+    story.extend([header_row, Spacer(1, 0.3 * cm)])
 
     # ===================================================================
     # REFERENCE / META ROW
     # ===================================================================
     ts_raw = alert.get("timestamp", "")
     try:
-        dt = datetime.strptime(ts_raw, "%Y-%m-%dT%H:%M:%S")
-        date_str = dt.strftime("%A, %d %B %Y")
-        time_str = dt.strftime("%H:%M:%S")
-        ref_date = dt.strftime("%Y%m%d")
+        dt = datetime.fromisoformat(ts_raw).astimezone()  # UTC with offset (older alerts: naive local) -> local
+        ref_date, time_str, date_str = dt.strftime("%Y%m%d|%H:%M:%S|%A, %d %B %Y").split("|")
     except Exception:
         date_str = ts_raw
         time_str = ""
@@ -346,44 +393,25 @@ def generate_pdf_report(
         ["REPORT REFERENCE", ref_number, "DATE ISSUED", date_str],
         ["CLASSIFICATION", "RESTRICTED — INTERNAL USE ONLY", "ALERT TYPE", alert_type_display],
     ]
-    meta_table = Table(
-        [[Paragraph(label, styles["ref_label"]),
-          Paragraph(value, styles["ref_value"])]
-         for row in meta_data for label, value in [(row[0], row[1]), (row[2], row[3])]],
-        colWidths=[CONTENT_W * 0.22, CONTENT_W * 0.28, CONTENT_W * 0.22, CONTENT_W * 0.28],
-        rowHeights=None,
-    )
-    # Re-build as a 2×4 table properly
-    meta_rows = []
-    for row in meta_data:
-        meta_rows.append([
+    meta_rows = [
+        [
             Paragraph(row[0], styles["ref_label"]),
             Paragraph(row[1], styles["ref_value"]),
             Paragraph(row[2], styles["ref_label"]),
             Paragraph(row[3], styles["ref_value"]),
-        ])
+        ]
+        for row in meta_data
+    ]
     meta_table = Table(
         meta_rows,
         colWidths=[CONTENT_W * 0.22, CONTENT_W * 0.28, CONTENT_W * 0.22, CONTENT_W * 0.28],
     )
-    meta_table.setStyle(TableStyle([
-        ("BACKGROUND",    (0, 0), (-1, -1), HOF_LIGHT),
-        ("TOPPADDING",    (0, 0), (-1, -1), 5),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
-        ("LEFTPADDING",   (0, 0), (-1, -1), 8),
-        ("RIGHTPADDING",  (0, 0), (-1, -1), 8),
-        ("GRID",          (0, 0), (-1, -1), 0.3, HexColor("#cbd5e1")),
-        ("VALIGN",        (0, 0), (-1, -1), "TOP"),
-    ]))
-    story.append(meta_table)
-    story.append(Spacer(1, 0.4 * cm))
+    meta_table.setStyle(_META_STYLE)
+    story.extend([meta_table, Spacer(1, 0.4 * cm)])
 
     # ===================================================================
     # INCIDENT OVERVIEW
     # ===================================================================
-    story.append(_section_banner("INCIDENT OVERVIEW", styles))
-    story.append(Spacer(1, 0.2 * cm))
-
     zone = alert.get("zone_name", "Analyst Zone")
     feed_num = alert.get("feed_id", 0) + 1
     location_full = f"1/2 Bond Street, HOF Capital Building, 2nd Floor, {zone}"
@@ -396,29 +424,10 @@ def generate_pdf_report(
         ("Detection Method", "Automated Restricted Zone Presence Detection"),
         ("Alert Status", "OPEN — Requires Immediate Review"),
     ]
-    ov_table = Table(
-        [[Paragraph(k, styles["field_label"]), Paragraph(v, styles["field_value"])]
-         for k, v in overview_rows],
-        colWidths=[CONTENT_W * 0.25, CONTENT_W * 0.75],
-    )
-    ov_table.setStyle(TableStyle([
-        ("TOPPADDING",    (0, 0), (-1, -1), 4),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-        ("LEFTPADDING",   (0, 0), (-1, -1), 6),
-        ("RIGHTPADDING",  (0, 0), (-1, -1), 6),
-        ("ROWBACKGROUNDS", (0, 0), (-1, -1), [HexColor("#f8fafc"), white]),
-        ("LINEBELOW", (0, 0), (-1, -2), 0.25, HexColor("#e2e8f0")),
-        ("VALIGN",    (0, 0), (-1, -1), "TOP"),
-    ]))
-    story.append(ov_table)
-    story.append(Spacer(1, 0.4 * cm))
 
     # ===================================================================
     # SUSPECT PROFILE + CCTV IMAGE
     # ===================================================================
-    story.append(_section_banner("SUSPECT PROFILE", styles))
-    story.append(Spacer(1, 0.2 * cm))
-
     person_name = alert.get("person_name", "Unknown")
     subject_label = (
         person_name if person_name.lower() != "unknown"
@@ -435,40 +444,71 @@ def generate_pdf_report(
         ("Registration", subject_status),
         ("Detected Zone", zone),
     ]
-    sus_table = Table(
-        [[Paragraph(k, styles["field_label"]), Paragraph(v, styles["field_value"])]
-         for k, v in suspect_rows],
-        colWidths=[CONTENT_W * 0.25, CONTENT_W * 0.75],
-    )
-    sus_table.setStyle(TableStyle([
+
+    # Both sections share column widths and row styling, so they are laid out as one Table:
+    # banner row, gap row, data rows per section (gap rows stand in for the old Spacers).
+    rows: list[list] = []
+    heights: list[float | None] = []
+    cmds: list[tuple] = [
         ("TOPPADDING",    (0, 0), (-1, -1), 4),
         ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
         ("LEFTPADDING",   (0, 0), (-1, -1), 6),
         ("RIGHTPADDING",  (0, 0), (-1, -1), 6),
-        ("ROWBACKGROUNDS", (0, 0), (-1, -1), [HexColor("#f8fafc"), white]),
-        ("LINEBELOW", (0, 0), (-1, -2), 0.25, HexColor("#e2e8f0")),
-        ("VALIGN",    (0, 0), (-1, -1), "TOP"),
-    ]))
-    story.append(sus_table)
-    story.append(Spacer(1, 0.3 * cm))
+        ("VALIGN",        (0, 0), (-1, -1), "TOP"),
+        # Labels are fixed short literals: plain-string cells styled here skip the paragraph
+        # parser. Values stay Paragraphs so long names/zones still wrap.
+        ("FONTNAME",      (0, 0), (0, -1), "Helvetica-Bold"),
+        ("FONTSIZE",      (0, 0), (0, -1), 8),
+        ("LEADING",       (0, 0), (0, -1), 10),
+        ("TEXTCOLOR",     (0, 0), (0, -1), HOF_SLATE),
+    ]
+    for title, section_rows in (("INCIDENT OVERVIEW", overview_rows), ("SUSPECT PROFILE", suspect_rows)):
+        if rows:
+            rows.append(["", ""])
+            heights.append(0.4 * cm)
+        b = len(rows)
+        rows.append([Paragraph(title, styles["section_head"]), ""])
+        rows.append(["", ""])
+        heights.extend([None, 0.2 * cm])
+        cmds.extend([
+            ("SPAN",          (0, b), (-1, b)),
+            ("BACKGROUND",    (0, b), (-1, b), HOF_DARK),
+            ("TOPPADDING",    (0, b), (-1, b), 5),
+            ("BOTTOMPADDING", (0, b), (-1, b), 5),
+            ("LEFTPADDING",   (0, b), (-1, b), 10),
+            ("RIGHTPADDING",  (0, b), (-1, b), 10),
+        ])
+        first = len(rows)
+        rows.extend(
+            [k, Paragraph(v, styles["field_value"])]
+            for k, v in section_rows
+        )
+        heights.extend([None] * len(section_rows))
+        last = len(rows) - 1
+        cmds.extend([
+            ("ROWBACKGROUNDS", (0, first), (-1, last), [HOF_ROWALT, white]),
+            ("LINEBELOW", (0, first), (-1, last - 1), 0.25, HOF_LINE),
+        ])
+    for i, h in enumerate(heights):
+        if h is not None:  # gap rows: no padding, fixed height
+            cmds.extend([("TOPPADDING", (0, i), (-1, i), 0), ("BOTTOMPADDING", (0, i), (-1, i), 0)])
+    info_table = Table(rows, colWidths=[CONTENT_W * 0.25, CONTENT_W * 0.75], rowHeights=heights)
+    info_table.setStyle(TableStyle(cmds))
+    story.extend([info_table, Spacer(1, 0.3 * cm)])
 
     # CCTV image
     alert_id = alert.get("alert_id", "")
     gif_path = data_dir / "recordings" / f"{alert_id}.gif"
-    frame_bytes = _extract_gif_frame(gif_path) if gif_path.exists() else None
+    frame = _extract_gif_frame(gif_path) if gif_path.exists() else None
 
-    if frame_bytes:
+    if frame:
         try:
-            img_buf = io.BytesIO(frame_bytes)
-            from PIL import Image as PILImage
-            pil = PILImage.open(img_buf)
-            iw, ih = pil.size
+            frame_bytes, (iw, ih) = frame
             max_img_w = CONTENT_W * 0.65
             scale = min(max_img_w / iw, (8 * cm) / ih, 1.0)
             disp_w = iw * scale
             disp_h = ih * scale
-            img_buf.seek(0)
-            rl_img = RLImage(img_buf, width=disp_w, height=disp_h)
+            rl_img = RLImage(io.BytesIO(frame_bytes), width=disp_w, height=disp_h)
 
             img_caption = Paragraph(
                 f"FIGURE 1 — CCTV INCIDENT FOOTAGE  |  Camera Feed {feed_num}  |  {zone}  |  {ts_raw}",
@@ -479,14 +519,7 @@ def generate_pdf_report(
                 [[rl_img], [Spacer(1, 0.1 * cm)], [img_caption]],
                 colWidths=[CONTENT_W],
             )
-            img_table.setStyle(TableStyle([
-                ("ALIGN",         (0, 0), (-1, -1), "CENTER"),
-                ("BACKGROUND",    (0, 0), (0, 0), HOF_DARK),
-                ("TOPPADDING",    (0, 0), (0, 0), 8),
-                ("BOTTOMPADDING", (0, 0), (0, 0), 8),
-                ("LEFTPADDING",   (0, 0), (-1, -1), 0),
-                ("RIGHTPADDING",  (0, 0), (-1, -1), 0),
-            ]))
+            img_table.setStyle(_FIGURE_STYLE)
             story.append(img_table)
         except Exception as e:
             logger.warning("Could not embed image in PDF: %s", e)
@@ -505,13 +538,13 @@ def generate_pdf_report(
     # ===================================================================
     # VLM ANALYSIS
     # ===================================================================
-    story.append(_section_banner(
-        "VLM ANALYSIS — NVIDIA NEMOTRON NANO 12B V2 VL", styles
-    ))
-    story.append(Spacer(1, 0.2 * cm))
+    story.extend([
+        _section_banner("VLM ANALYSIS — NVIDIA NEMOTRON NANO 12B V2 VL", styles),
+        Spacer(1, 0.2 * cm),
+    ])
 
     tl = nemotron.get("threat_level", "HIGH")
-    tl_color = HOF_RED if tl == "HIGH" else HOF_AMBER if tl == "MEDIUM" else HexColor("#22c55e")
+    tl_color = HOF_RED if tl == "HIGH" else HOF_AMBER if tl == "MEDIUM" else HOF_GREEN
     tl_style = ParagraphStyle(
         "tl_inline",
         parent=styles["field_value"],
@@ -542,29 +575,20 @@ def generate_pdf_report(
             colWidths=[CONTENT_W * 0.28, CONTENT_W * 0.72],
         )
 
-    vlm_table.setStyle(TableStyle([
-        ("TOPPADDING",    (0, 0), (-1, -1), 4),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-        ("LEFTPADDING",   (0, 0), (-1, -1), 6),
-        ("RIGHTPADDING",  (0, 0), (-1, -1), 6),
-        ("ROWBACKGROUNDS", (0, 0), (-1, -1), [HexColor("#f8fafc"), white]),
-        ("LINEBELOW", (0, 0), (-1, -2), 0.25, HexColor("#e2e8f0")),
-        ("VALIGN",    (0, 0), (-1, -1), "TOP"),
-    ]))
-    story.append(vlm_table)
-    story.append(Spacer(1, 0.4 * cm))
+    vlm_table.setStyle(_FIELDS_STYLE)
+    story.extend([vlm_table, Spacer(1, 0.4 * cm)])
 
     # ===================================================================
     # ESCALATION ASSESSMENT (Nemotron Super 49B)
     # ===================================================================
     if escalation and escalation.get("available"):
-        story.append(_section_banner(
-            "ESCALATION ASSESSMENT — NVIDIA NEMOTRON SUPER 49B", styles
-        ))
-        story.append(Spacer(1, 0.2 * cm))
+        story.extend([
+            _section_banner("ESCALATION ASSESSMENT — NVIDIA NEMOTRON SUPER 49B", styles),
+            Spacer(1, 0.2 * cm),
+        ])
 
         esc_level = escalation.get("escalation_level", "CRITICAL")
-        esc_color = HOF_RED if esc_level == "CRITICAL" else HOF_AMBER if esc_level == "URGENT" else HexColor("#22c55e")
+        esc_color = HOF_RED if esc_level == "CRITICAL" else HOF_AMBER if esc_level == "URGENT" else HOF_GREEN
         esc_style = ParagraphStyle(
             "esc_inline",
             parent=styles["field_value"],
@@ -584,62 +608,60 @@ def generate_pdf_report(
                for k, v in esc_rows],
             colWidths=[CONTENT_W * 0.28, CONTENT_W * 0.72],
         )
-        esc_table.setStyle(TableStyle([
-            ("TOPPADDING",    (0, 0), (-1, -1), 4),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-            ("LEFTPADDING",   (0, 0), (-1, -1), 6),
-            ("RIGHTPADDING",  (0, 0), (-1, -1), 6),
-            ("ROWBACKGROUNDS", (0, 0), (-1, -1), [HexColor("#f8fafc"), white]),
-            ("LINEBELOW", (0, 0), (-1, -2), 0.25, HexColor("#e2e8f0")),
-            ("VALIGN",    (0, 0), (-1, -1), "TOP"),
-        ]))
-        story.append(esc_table)
-        story.append(Spacer(1, 0.4 * cm))
+        esc_table.setStyle(_FIELDS_STYLE)
+        story.extend([esc_table, Spacer(1, 0.4 * cm)])
 
     # ===================================================================
     # FORMAL WRITTEN REPORT (Claude)
     # ===================================================================
-    story.append(_section_banner("FORMAL SECURITY INCIDENT REPORT", styles))
-    story.append(Spacer(1, 0.25 * cm))
+    story.extend([_section_banner("FORMAL SECURITY INCIDENT REPORT", styles), Spacer(1, 0.25 * cm)])
+
+    # Split on section headings (ALL CAPS lines); consecutive body lines share one Paragraph.
+    body_buf: list[str] = []
+
+    def _flush_body() -> None:
+        if body_buf:
+            story.append(Paragraph("<br/>".join(body_buf), styles["body"]))
+            body_buf.clear()
 
-    # Split on section headings (ALL CAPS lines)
     for line in report_text.splitlines():
         stripped = line.strip()
         if not stripped:
+            _flush_body()
             story.append(Spacer(1, 0.15 * cm))
             continue
         # Detect section headings: all uppercase, no trailing period
-        if stripped.isupper() and len(stripped) > 3 and not stripped.endswith("."):
+        if _HEADING_RE.match(stripped):
+            _flush_body()
             story.append(Paragraph(stripped, styles["body_bold"]))
         else:
-            story.append(Paragraph(stripped, styles["body"]))
+            body_buf.append(stripped)
+    _flush_body()
 
     story.append(Spacer(1, 0.5 * cm))
 
     # ===================================================================
     # FOOTER
     # ===================================================================
-    story.append(_hr(HOF_NAVY, 1))
-    story.append(Spacer(1, 0.1 * cm))
+    story.extend([_hr(HOF_NAVY, 1), Spacer(1, 0.1 * cm)])
 
     now_str = datetime.now().strftime("%d %B %Y at %H:%M:%S")
-    story.append(Paragraph("CONFIDENTIAL — INTERNAL USE ONLY", styles["confidential"]))
-    story.append(Spacer(1, 0.1 * cm))
-    story.append(Paragraph(
-        f"Generated by LockDown Security System  |  HOF Capital Management  |  {now_str}",
-        styles["footer"],
-    ))
-    story.append(Paragraph(
-        f"Incident ID: {alert.get('alert_id', 'N/A')}",
-        styles["footer"],
-    ))
-    story.append(Spacer(1, 0.1 * cm))
-    story.append(Paragraph(
-        "This report is confidential and intended solely for authorised HOF Capital personnel. "
-        "Unauthorised disclosure, copying, or distribution is strictly prohibited. "
-        "© 2026 HOF Capital Management. All rights reserved.",
-        styles["footer"],
-    ))
+    story.extend([
+        Paragraph("CONFIDENTIAL — INTERNAL USE ONLY", styles["confidential"]),
+        Spacer(1, 0.1 * cm),
+        Paragraph(
+            f"Generated by LockDown Security System  |  HOF Capital Management  |  {now_str}",
+            styles["footer"],
+        ),
+        Paragraph(f"Incident ID: {alert.get('alert_id', 'N/A')}", styles["footer"]),
+        Spacer(1, 0.1 * cm),
+        Paragraph(
+            "This report is confidential and intended solely for authorised HOF Capital personnel. "
+            "Unauthorised disclosure, copying, or distribution is strictly prohibited. "
+            "© 2026 HOF Capital Management. All rights reserved.",
+            styles["footer"],
+        ),
+    ])
 
     doc.build(story)
-    return buf.getvalue()
+    return buf.getvalue() if out is None else None
@@ -1,5 +1,13 @@
+from typing import Literal
+
 from pydantic import BaseModel
 
+# Closed string sets; Literal validation is a cheap membership check and shows up as an enum in OpenAPI.
+RestrictionLevel = Literal["restricted", "authorized_only", "public"]
+AlertType = Literal["unauthorized_door_access", "zone_presence", "line_crossing"]
+Resolution = Literal["acknowledged", "problem_fixed"]
+CameraZoneType = Literal["polygon", "line"]
+
 
 class DetectionItem(BaseModel):
     bbox: list[float]  # [x1, y1, x2, y2] in image coordinates
@@ -60,7 +68,7 @@ class DoorItem(BaseModel):
     point: list[float]  # [x, y] normalized 0-1
     feed_id: int  # camera feed index for this door (same feed does face + door analysis)
     allowed_roles: list[str] = []
-    restriction_level: str = "restricted"
+    restriction_level: RestrictionLevel = "restricted"
     rules: ZoneRules | None = None
 
 
@@ -73,7 +81,7 @@ class CreateDoorBody(BaseModel):
     point: list[float]
     feed_id: int
     allowed_roles: list[str] = []
-    restriction_level: str = "restricted"
+    restriction_level: RestrictionLevel = "restricted"
     rules: ZoneRules | None = None
 
 
@@ -82,7 +90,7 @@ class UpdateDoorBody(BaseModel):
     point: list[float] | None = None
     feed_id: int | None = None
     allowed_roles: list[str] | None = None
-    restriction_level: str | None = None
+    restriction_level: RestrictionLevel | None = None
     rules: ZoneRules | None = None
 
 
@@ -92,7 +100,7 @@ class ZoneItem(BaseModel):
     type: str  # "rect" | "polygon" | "path"
     points: list[list[float]]  # [[x,y],...] normalized 0-1
     allowed_roles: list[str] = []
-    restriction_level: str = "restricted"  # "restricted" | "authorized_only" | "public"
+    restriction_level: RestrictionLevel = "restricted"
     rules: ZoneRules | None = None
 
 
@@ -105,14 +113,14 @@ class CreateZoneBody(BaseModel):
     type: str
     points: list[list[float]]
     allowed_roles: list[str] = []
-    restriction_level: str = "restricted"
+    restriction_level: RestrictionLevel = "restricted"
     rules: ZoneRules | None = None
 
 
 class UpdateZoneBody(BaseModel):
     name: str | None = None
     allowed_roles: list[str] | None = None
-    restriction_level: str | None = None
+    restriction_level: RestrictionLevel | None = None
     rules: ZoneRules | None = None
 
 
@@ -133,8 +141,12 @@ class DoorAreaUpdateBody(BaseModel):
     areas: list[DoorAreaItem]
 
 
+class BboxItem(BaseModel):
+    bbox: tuple[float, float, float, float]  # [x1, y1, x2, y2] in image coordinates
+
+
 class DoorDetectResponse(BaseModel):
-    doors: list[dict]  # [{ "bbox": [x1,y1,x2,y2] }, ...]
+    doors: list[BboxItem]
     movement_detected: bool
     area_name: str | None
     last_person: dict | None  # { "name", "role", "identity_id" } or null
@@ -147,7 +159,7 @@ class DoorDetectResponse(BaseModel):
 # Combined face + door analysis on same frame (one feed = camera at door)
 class FeedAnalyzeResponse(BaseModel):
     detections: list[DetectionItem]  # faces
-    doors: list[dict]
+    doors: list[BboxItem]
     movement_detected: bool
     area_name: str | None
     last_person: dict | None
@@ -161,7 +173,7 @@ class FeedAnalyzeResponse(BaseModel):
 class SecurityAlert(BaseModel):
     alert_id: str
     timestamp: str
-    alert_type: str  # "unauthorized_door_access" | "zone_presence" | "line_crossing"
+    alert_type: AlertType
     feed_id: int
     person_name: str
     person_role: str | None
@@ -169,7 +181,7 @@ class SecurityAlert(BaseModel):
     zone_name: str | None
     details: str
     acknowledged: bool
-    resolution: str | None = None  # "acknowledged" | "problem_fixed" (C-level action)
+    resolution: Resolution | None = None  # C-level action
     recording_url: str | None = None  # URL to animated GIF clip of the violation
 
 
@@ -182,7 +194,7 @@ class CameraZone(BaseModel):
     id: str
     feed_id: int
     name: str
-    zone_type: str  # "polygon" | "line"
+    zone_type: CameraZoneType
     points: list[list[float]]  # [[x,y], ...] normalized 0-1
     authorized_roles: list[str] = []
     color: str = "#ef4444"
@@ -196,7 +208,7 @@ class CameraZonesListResponse(BaseModel):
 class CreateCameraZoneBody(BaseModel):
     feed_id: int
     name: str
-    zone_type: str = "polygon"
+    zone_type: CameraZoneType = "polygon"
     points: list[list[float]]
     authorized_roles: list[str] = []
     color: str = "#ef4444"
@@ -205,7 +217,7 @@ class CreateCameraZoneBody(BaseModel):
 
 class UpdateCameraZoneBody(BaseModel):
     name: str | None = None
-    zone_type: str | None = None
+    zone_type: CameraZoneType | None = None
     points: list[list[float]] | None = None
     authorized_roles: list[str] | None = None
     color: str | None = None
@@ -3,34 +3,199 @@ Security alert logging for:
   Feature 1: Unauthorized face + door open  (alert_type="unauthorized_door_access")
   Feature 2: Restricted zone crossing/presence (alert_type="line_crossing" | "zone_presence")
 
-Alerts are persisted to data/security_alerts.json (up to 1000 entries, newest last).
+Alerts are persisted to data/security_alerts.json (newest last; trimmed to the newest
+MAX_ALERTS whenever the log passes COMPACT_AT).
+New alerts and per-alert patches (acknowledge/resolve, recording/report urls) are appended to
+data/security_alerts.journal.ndjson and folded back into the snapshot by compaction.
+Snapshot rewrites are debounced (FLUSH_DELAY); flush_alerts() runs on shutdown and at exit.
 """
 from __future__ import annotations
 
-import json
-import time
+import atexit
+import os
+import threading
 import uuid
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 
 def _get_path(data_dir: Path) -> Path:
     return data_dir / "security_alerts.json"
 
 
+def _journal_path(data_dir: Path) -> Path:
+    return data_dir / "security_alerts.journal.ndjson"
+
+
+def _stat(p: Path) -> tuple[int, int]:
+    try:
+        st = p.stat()
+    except OSError:
+        return (0, 0)
+    return (st.st_mtime_ns, st.st_size)
+
+
 def _load(data_dir: Path) -> list[dict]:
+    """Snapshot with the journal (new alerts and patches, in order) replayed on top."""
     p = _get_path(data_dir)
-    if not p.exists():
-        return []
+    alerts: list[dict] = []
+    if p.exists():
+        try:
+            alerts = orjson.loads(p.read_bytes())
+        except Exception:
+            alerts = []
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
-    except Exception:
-        return []
+        journal = _journal_path(data_dir).read_bytes()
+    except OSError:
+        return alerts
+    by_id = {a.get("alert_id"): a for a in alerts}
+    for line in journal.splitlines():
+        try:
+            entry = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            continue  # torn tail from a crash mid-append
+        new = entry.get("alert")
+        if new is not None:
+            if new.get("alert_id") not in by_id:
+                alerts.append(new)
+                by_id[new.get("alert_id")] = new
+            continue
+        a = by_id.get(entry.get("alert_id"))
+        if a is not None:
+            a.update(entry.get("set") or {})
+    return alerts[-MAX_ALERTS:]
+
+
+def _write_snapshot(p: Path) -> None:
+    """Write the cached log for snapshot path p atomically (tmp file + os.replace), then drop the journal.
+
+    The snapshot then holds every journalled patch. Replaying a leftover journal after a crash
+    in between is harmless (patches only set fields). Caller holds _write_lock.
+    """
+    _, alerts, by_id = _alerts_cache[p]
+    tmp = p.with_suffix(".json.tmp")
+    tmp.write_bytes(orjson.dumps(alerts, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    os.replace(tmp, p)
+    try:
+        _journal_path(p.parent).unlink()
+    except FileNotFoundError:
+        pass
+    _alerts_cache[p] = (_file_version(p.parent), alerts, by_id)
+    _dirty.discard(p)
 
 
-def _save(data_dir: Path, alerts: list[dict]) -> None:
+def _save(data_dir: Path, alerts: list[dict], sync: bool = False) -> None:
+    """
+    Replace the log. The new list becomes the cache immediately (write-through); the disk
+    write is debounced so a burst of alerts costs one rewrite per FLUSH_DELAY, not one each.
+    sync=True writes before returning.
+    """
+    global _generation
     p = _get_path(data_dir)
-    p.write_text(json.dumps(alerts, indent=2, ensure_ascii=False), encoding="utf-8")
+    _alerts_cache[p] = ((), alerts, {a.get("alert_id"): a for a in alerts})
+    _generation += 1
+    _dirty.add(p)
+    if sync:
+        _write_snapshot(p)
+    else:
+        _schedule_flush()
+
+
+# Parsed log + alert_id index keyed by path, valid while the snapshot's and the journal's
+# (mtime_ns, size) hold. Writers update it in place (patches) or replace it (rewrites).
+# Paths in _dirty have a newer cache than their file: the cache is authoritative until flushed.
+_alerts_cache: dict[Path, tuple[tuple[int, ...], list[dict], dict[str, dict]]] = {}
+_dirty: set[Path] = set()
+_generation = 0  # bumped on every in-memory rewrite; part of alerts_version
+# Serializes writers so a snapshot rewrite cannot drop a patch appended while it was building.
+_write_lock = threading.Lock()
+
+MAX_ALERTS = 1000
+COMPACT_AT = 1500          # alerts held before the log is compacted back to MAX_ALERTS
+JOURNAL_MIN = 64 * 1024    # journal bytes always tolerated before compaction (empty snapshot)
+FLUSH_DELAY = 0.25  # seconds a rewrite may sit in memory before it is written
+_flush_timer: threading.Timer | None = None
+
+
+def _schedule_flush() -> None:
+    """Start the flush timer unless one is pending (caller holds _write_lock)."""
+    global _flush_timer
+    if _flush_timer is None or not _flush_timer.is_alive():
+        _flush_timer = threading.Timer(FLUSH_DELAY, flush_alerts)
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+
+def flush_alerts() -> None:
+    """Write every pending alert-log rewrite to disk (timer, shutdown and atexit)."""
+    with _write_lock:
+        for p in list(_dirty):
+            _write_snapshot(p)
+
+
+atexit.register(flush_alerts)
+
+
+def _file_version(data_dir: Path) -> tuple[int, int, int, int]:
+    return _stat(_get_path(data_dir)) + _stat(_journal_path(data_dir))
+
+
+def _cached(data_dir: Path) -> tuple[list[dict], dict[str, dict]]:
+    p = _get_path(data_dir)
+    hit = _alerts_cache.get(p)
+    if hit is not None and p in _dirty:
+        return hit[1], hit[2]
+    key = _file_version(data_dir)
+    if key == (0, 0, 0, 0):
+        return [], {}
+    if hit is not None and hit[0] == key:
+        return hit[1], hit[2]
+    alerts = _load(data_dir)
+    by_id = {a.get("alert_id"): a for a in alerts}
+    _alerts_cache[p] = (key, alerts, by_id)
+    return alerts, by_id
+
+
+def _append(data_dir: Path, entry: dict, alerts: list[dict], by_id: dict[str, dict]) -> None:
+    """
+    Journal one entry whose effect the caller already applied to the cached alerts/by_id,
+    then compact once the journal outgrows twice the snapshot or the log passes COMPACT_AT.
+    Caller holds _write_lock.
+    """
+    global _generation
+    with open(_journal_path(data_dir), "ab") as f:
+        f.write(orjson.dumps(entry) + b"\n")
+    _generation += 1
+    p = _get_path(data_dir)
+    if p in _dirty:
+        # The pending flush writes the cache and drops the journal; only the cap needs applying.
+        if len(alerts) > COMPACT_AT:
+            _save(data_dir, alerts[-MAX_ALERTS:])
+        return
+    key = _file_version(data_dir)
+    _alerts_cache[p] = (key, alerts, by_id)
+    if key[3] > max(2 * key[1], JOURNAL_MIN) or len(alerts) > COMPACT_AT:
+        _save(data_dir, alerts[-MAX_ALERTS:])
+
+
+def _patch(data_dir: Path, alert_id: str, fields: dict) -> Optional[dict]:
+    """Apply a field patch by appending one journal line instead of rewriting the whole log."""
+    with _write_lock:
+        alerts, by_id = _cached(data_dir)
+        a = by_id.get(alert_id)
+        if a is None:
+            return None
+        a.update(fields)
+        _append(data_dir, {"alert_id": alert_id, "set": fields}, alerts, by_id)
+        return dict(a)
+
+
+def new_alert_id() -> str:
+    """Allocate an alert id up front so artifacts (recordings) can be saved before logging."""
+    return str(uuid.uuid4())
 
 
 def log_alert(
@@ -44,12 +209,16 @@ def log_alert(
     zone_name: Optional[str] = None,
     details: str = "",
     recording_url: Optional[str] = None,
+    alert_id: Optional[str] = None,
 ) -> dict:
-    """Append a new security alert to the persistent log. Returns the created alert dict."""
-    alerts = _load(data_dir)
+    """Append a new security alert to the persistent log. Returns the created alert dict.
+
+    Pass a pre-allocated alert_id (see new_alert_id) together with recording_url so the
+    alert is written once, complete, instead of being patched after the fact.
+    """
     alert = {
-        "alert_id": str(uuid.uuid4()),
-        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
+        "alert_id": alert_id or new_alert_id(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
         "alert_type": alert_type,
         "feed_id": feed_id,
         "person_name": person_name,
@@ -61,11 +230,12 @@ def log_alert(
         "resolution": None,  # None | "acknowledged" | "problem_fixed"
         "recording_url": recording_url,
     }
-    alerts.append(alert)
-    # Cap at 1000 entries
-    if len(alerts) > 1000:
-        alerts = alerts[-1000:]
-    _save(data_dir, alerts)
+    # One journal line; the log is trimmed back to MAX_ALERTS when it is compacted.
+    with _write_lock:
+        alerts, by_id = _cached(data_dir)
+        alerts.append(alert)
+        by_id[alert["alert_id"]] = alert
+        _append(data_dir, {"alert": alert}, alerts, by_id)
 
     # Sync to Supabase (fire-and-forget, local JSON is source of truth)
     try:
@@ -77,15 +247,42 @@ def log_alert(
     return alert
 
 
+def update_alert(data_dir: Path, alert_id: str, **fields) -> Optional[dict]:
+    """Patch fields on a single alert via one journal append. Returns the updated alert or None."""
+    return _patch(data_dir, alert_id, fields)
+
+
+def alerts_version(data_dir: Path) -> tuple[int, ...]:
+    """Cheap change token for the alert log: file (mtime_ns, size) pairs plus the in-memory generation."""
+    return _file_version(data_dir) + (_generation,)
+
+
+def compact_alerts(data_dir: Path) -> None:
+    """Fold the patch journal into the snapshot (run at startup)."""
+    with _write_lock:
+        if _get_path(data_dir) in _dirty:
+            _write_snapshot(_get_path(data_dir))
+        elif _journal_path(data_dir).exists():
+            _save(data_dir, _load(data_dir), sync=True)
+
+
 def get_alerts(data_dir: Path, limit: int = 200) -> list[dict]:
-    """Return most recent alerts, newest first."""
-    alerts = _load(data_dir)
-    return list(reversed(alerts[-limit:]))
+    """Return most recent alerts, newest first (shared cached dicts; treat as read-only)."""
+    if limit <= 0:
+        return []
+    alerts, _ = _cached(data_dir)
+    return alerts[: -limit - 1 : -1]  # one reversed slice (clamps when fewer than limit)
+
+
+def get_alert(data_dir: Path, alert_id: str) -> Optional[dict]:
+    """Return a single alert by id, or None (shared cached dict; treat as read-only)."""
+    return _cached(data_dir)[1].get(alert_id)
 
 
 def clear_alerts(data_dir: Path) -> None:
     """Delete all alerts."""
-    _save(data_dir, [])
+    with _write_lock:
+        _save(data_dir, [], sync=True)
     try:
         from app.supabase_service import clear_incidents
         clear_incidents()
@@ -102,16 +299,11 @@ def resolve_alert(data_dir: Path, alert_id: str, resolution: str) -> bool:
     """Set resolution for a single alert: 'acknowledged' or 'problem_fixed'. Returns True if found."""
     if resolution not in ("acknowledged", "problem_fixed"):
         return False
-    alerts = _load(data_dir)
-    for a in alerts:
-        if a.get("alert_id") == alert_id:
-            a["acknowledged"] = True
-            a["resolution"] = resolution
-            _save(data_dir, alerts)
-            try:
-                from app.supabase_service import resolve_incident
-                resolve_incident(alert_id, resolution)
-            except Exception:
-                pass
-            return True
-    return False
+    if _patch(data_dir, alert_id, {"acknowledged": True, "resolution": resolution}) is None:
+        return False
+    try:
+        from app.supabase_service import resolve_incident
+        resolve_incident(alert_id, resolution)
+    except Exception:
+        pass
+    return True
@@ -4,13 +4,42 @@ Persists security incidents, registered persons, and visitor logs to Supabase.
 Uploads GIF recordings, PDF reports, and threat images to Supabase Storage.
 
 Falls back gracefully when Supabase is unavailable (local JSON still works).
+Incident upserts are queued and sent as one multi-row upsert every FLUSH_DELAY seconds.
 """
 from __future__ import annotations
 
+import atexit
 import logging
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+try:
+    from supabase import create_client
+except ImportError:
+    create_client = None
+
+FLUSH_DELAY = 0.2  # seconds queued incident upserts wait before one batched request
+
+_pending_incidents: dict[str, dict] = {}  # alert_id -> row; a re-upsert before the flush replaces it
+_pending_lock = threading.Lock()
+# Held for a whole flush, HTTP call included: once an update acquires it, no row it took from
+# _pending_incidents is still in flight.
+_flush_lock = threading.Lock()
+_flush_timer: threading.Timer | None = None
+
+_context_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="supabase-ctx")
+_upload_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="supabase-upload")
+
+READ_CACHE_TTL = 30.0  # seconds person reads are served from memory
+READ_CACHE_MAX = 256
+
+# ("context", name) | ("persons", role, visitors_only) -> (expires_at, result)
+_read_cache: dict[tuple, tuple[float, object]] = {}
+_read_lock = threading.Lock()
+
 logger = logging.getLogger(__name__)
 
 _client = None
@@ -27,9 +56,11 @@ def _get_client():
     if not url or not key:
         logger.warning("SUPABASE_URL / SUPABASE_ANON_KEY not set – Supabase disabled")
         return None
+    if create_client is None:
+        logger.warning("supabase not installed – Supabase disabled")
+        return None
 
     try:
-        from supabase import create_client
         _client = create_client(url, key)
         logger.info("Supabase client initialized: %s", url)
         return _client
@@ -38,15 +69,39 @@ def _get_client():
         return None
 
 
-# ── Security Incidents ─────────────────────────────────────────────────────
+def _cache_get(key: tuple):
+    hit = _read_cache.get(key)
+    if hit is not None and hit[0] > time.monotonic():
+        return hit[1]
+    return None
 
-def upsert_incident(alert: dict) -> bool:
-    """Insert or update a security incident row. Returns True on success."""
-    client = _get_client()
-    if not client:
-        return False
 
-    row = {
+def _cache_put(key: tuple, value) -> None:
+    now = time.monotonic()
+    with _read_lock:
+        if len(_read_cache) >= READ_CACHE_MAX:
+            for k in [k for k, (exp, _) in _read_cache.items() if exp <= now]:
+                del _read_cache[k]
+            if len(_read_cache) >= READ_CACHE_MAX:
+                _read_cache.clear()
+        _read_cache[key] = (now + READ_CACHE_TTL, value)
+
+
+def invalidate_person(name: Optional[str] = None) -> None:
+    """Drop cached person reads: one person's context plus every persons list, or everything if name is None."""
+    with _read_lock:
+        if name is None:
+            _read_cache.clear()
+            return
+        _read_cache.pop(("context", name), None)
+        for k in [k for k in _read_cache if k[0] == "persons"]:
+            del _read_cache[k]
+
+
+# ── Security Incidents ─────────────────────────────────────────────────────
+
+def _incident_row(alert: dict) -> dict:
+    return {
         "alert_id": alert["alert_id"],
         "timestamp": alert.get("timestamp"),
         "alert_type": alert.get("alert_type"),
@@ -64,19 +119,89 @@ def upsert_incident(alert: dict) -> bool:
         "escalation_level": alert.get("escalation_level"),
         "escalation_reasoning": alert.get("escalation_reasoning"),
     }
+
+
+def _upsert_rows(rows: list[dict]) -> bool:
+    client = _get_client()
+    if not client:
+        return False
     try:
-        client.table("security_incidents").upsert(row, on_conflict="alert_id").execute()
+        client.table("security_incidents").upsert(rows, on_conflict="alert_id").execute()
         return True
     except Exception:
-        logger.exception("Failed to upsert incident %s", alert.get("alert_id"))
+        logger.exception("Failed to upsert %d incident(s)", len(rows))
+        return False
+
+
+def upsert_incidents_bulk(alerts: list[dict]) -> bool:
+    """Insert or update many incidents in one request. Returns True on success."""
+    if not alerts:
+        return True
+    return _upsert_rows([_incident_row(a) for a in alerts])
+
+
+def upsert_incident(alert: dict, sync: bool = False) -> bool:
+    """Insert or update a security incident row.
+
+    Queued for the next batched flush by default (True means queued); pass sync=True
+    to send it now and get the real outcome.
+    """
+    global _flush_timer
+    if sync:
+        return upsert_incidents_bulk([alert])
+    if not _get_client():
         return False
+    with _pending_lock:
+        _pending_incidents[alert["alert_id"]] = _incident_row(alert)
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(FLUSH_DELAY, flush_incidents)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+    return True
+
+
+def flush_incidents() -> bool:
+    """Send every queued incident upsert now (one request). Returns True on success."""
+    with _flush_lock:
+        return _flush_pending()
+
+
+def _flush_pending() -> bool:
+    """flush_incidents body; caller holds _flush_lock."""
+    global _flush_timer
+    with _pending_lock:
+        rows = list(_pending_incidents.values())
+        _pending_incidents.clear()
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+    return _upsert_rows(rows) if rows else True
+
+
+atexit.register(flush_incidents)
 
 
 def update_incident_field(alert_id: str, **fields) -> bool:
-    """Update specific fields on an existing incident."""
+    """Update specific fields on an existing incident.
+
+    A row still queued for the batched upsert takes the fields in place (one multi-row upsert
+    needs identical keys per row, so only its existing columns are merged this way).
+    """
     client = _get_client()
     if not client:
         return False
+    with _pending_lock:
+        row = _pending_incidents.get(alert_id)
+        if row is not None and fields.keys() <= row.keys():
+            row.update(fields)
+            return True
+    # Otherwise the row must exist before it can be updated: send it if it is queued, and
+    # wait out a flush that already took it but whose upsert has not landed yet.
+    with _flush_lock:
+        with _pending_lock:
+            queued = alert_id in _pending_incidents
+        if queued:
+            _flush_pending()
     try:
         client.table("security_incidents").update(fields).eq("alert_id", alert_id).execute()
         return True
@@ -102,7 +227,11 @@ def get_incidents(limit: int = 200) -> list[dict]:
     try:
         resp = (
             client.table("security_incidents")
-            .select("*")
+            .select(
+                "alert_id, timestamp, alert_type, feed_id, person_name, person_role, authorized, "
+                "zone_name, details, acknowledged, resolution, recording_url, report_url, "
+                "threat_image_url, escalation_level"
+            )
             .order("timestamp", desc=True)
             .limit(limit)
             .execute()
@@ -118,6 +247,8 @@ def clear_incidents() -> bool:
     client = _get_client()
     if not client:
         return False
+    with _pending_lock:
+        _pending_incidents.clear()
     try:
         client.table("security_incidents").delete().neq("alert_id", "").execute()
         return True
@@ -128,6 +259,9 @@ def clear_incidents() -> bool:
 
 # ── Registered Persons ─────────────────────────────────────────────────────
 
+_PERSON_COLUMNS = "identity_id, name, role, authorized, is_visitor, registered_at"
+
+
 def upsert_person(identity_id: str, name: str, role: str, authorized: bool = True) -> bool:
     """Insert or update a registered person."""
     client = _get_client()
@@ -144,6 +278,7 @@ def upsert_person(identity_id: str, name: str, role: str, authorized: bool = Tru
     }
     try:
         client.table("registered_persons").upsert(row, on_conflict="identity_id").execute()
+        invalidate_person(name)
         return True
     except Exception:
         logger.exception("Failed to upsert person %s", identity_id)
@@ -157,6 +292,7 @@ def delete_person(identity_id: str) -> bool:
         return False
     try:
         client.table("registered_persons").delete().eq("identity_id", identity_id).execute()
+        invalidate_person()  # only the identity_id is known here
         return True
     except Exception:
         logger.exception("Failed to delete person %s", identity_id)
@@ -164,18 +300,24 @@ def delete_person(identity_id: str) -> bool:
 
 
 def get_persons(role: Optional[str] = None, visitors_only: bool = False) -> list[dict]:
-    """Fetch registered persons, optionally filtered."""
+    """Fetch registered persons, optionally filtered (cached for READ_CACHE_TTL; treat as read-only)."""
     client = _get_client()
     if not client:
         return []
+    key = ("persons", role, visitors_only)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
     try:
-        q = client.table("registered_persons").select("*")
+        q = client.table("registered_persons").select(_PERSON_COLUMNS)
         if role:
             q = q.eq("role", role)
         if visitors_only:
             q = q.eq("is_visitor", True)
         resp = q.order("registered_at", desc=True).execute()
-        return resp.data or []
+        persons = resp.data or []
+        _cache_put(key, persons)
+        return persons
     except Exception:
         logger.exception("Failed to fetch persons")
         return []
@@ -230,6 +372,16 @@ def upload_file(bucket: str, path: str, file_bytes: bytes, content_type: str) ->
         return None
 
 
+def upload_files(uploads: list[tuple[str, str, bytes, str]]) -> list[Optional[str]]:
+    """Upload several (bucket, path, file_bytes, content_type) files concurrently.
+
+    Returns the public URL (or None) for each upload, in order.
+    """
+    if len(uploads) <= 1:
+        return [upload_file(*u) for u in uploads]
+    return list(_upload_pool.map(lambda u: upload_file(*u), uploads))
+
+
 def upload_recording(alert_id: str, gif_bytes: bytes) -> Optional[str]:
     """Upload a GIF recording to Supabase Storage."""
     return upload_file("recordings", f"{alert_id}.gif", gif_bytes, "image/gif")
@@ -254,52 +406,71 @@ def get_person_context(person_name: str) -> dict:
       - profile: registered_persons row (or None if unknown)
       - prior_incidents: list of past security_incidents involving this person
       - visitor_events: recent visitor_log entries (if any)
+
+    Cached per name for READ_CACHE_TTL seconds (treat as read-only).
     """
     result: dict = {"profile": None, "prior_incidents": [], "visitor_events": []}
     client = _get_client()
     if not client:
         return result
+    key = ("context", person_name)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
 
     # 1. Look up registered profile
-    try:
-        resp = (
-            client.table("registered_persons")
-            .select("*")
-            .eq("name", person_name)
-            .limit(1)
-            .execute()
-        )
-        if resp.data:
-            result["profile"] = resp.data[0]
-    except Exception:
-        logger.debug("Supabase profile lookup failed for %s", person_name)
+    def _profile() -> bool:
+        try:
+            resp = (
+                client.table("registered_persons")
+                .select(_PERSON_COLUMNS)
+                .eq("name", person_name)
+                .limit(1)
+                .execute()
+            )
+            if resp.data:
+                result["profile"] = resp.data[0]
+            return True
+        except Exception:
+            logger.debug("Supabase profile lookup failed for %s", person_name)
+            return False
 
     # 2. Prior incidents involving this person
-    try:
-        resp = (
-            client.table("security_incidents")
-            .select("alert_id, timestamp, alert_type, zone_name, escalation_level, resolution")
-            .eq("person_name", person_name)
-            .order("timestamp", desc=True)
-            .limit(10)
-            .execute()
-        )
-        result["prior_incidents"] = resp.data or []
-    except Exception:
-        logger.debug("Supabase incident history lookup failed for %s", person_name)
+    def _incidents() -> bool:
+        try:
+            resp = (
+                client.table("security_incidents")
+                .select("alert_id, timestamp, alert_type, zone_name, escalation_level, resolution")
+                .eq("person_name", person_name)
+                .order("timestamp", desc=True)
+                .limit(10)
+                .execute()
+            )
+            result["prior_incidents"] = resp.data or []
+            return True
+        except Exception:
+            logger.debug("Supabase incident history lookup failed for %s", person_name)
+            return False
 
     # 3. Visitor log (if they were ever checked in as a visitor)
-    try:
-        resp = (
-            client.table("visitor_log")
-            .select("*")
-            .eq("person_name", person_name)
-            .order("event_time", desc=True)
-            .limit(5)
-            .execute()
-        )
-        result["visitor_events"] = resp.data or []
-    except Exception:
-        logger.debug("Supabase visitor log lookup failed for %s", person_name)
-
+    def _visitor_events() -> bool:
+        try:
+            resp = (
+                client.table("visitor_log")
+                .select("action, zone_name, event_time:timestamp")
+                .eq("person_name", person_name)
+                .order("timestamp", desc=True)
+                .limit(5)
+                .execute()
+            )
+            result["visitor_events"] = resp.data or []
+            return True
+        except Exception:
+            logger.debug("Supabase visitor log lookup failed for %s", person_name)
+            return False
+
+    # The three lookups are independent round-trips; run them concurrently.
+    futures = [_context_pool.submit(fn) for fn in (_profile, _incidents, _visitor_events)]
+    if all([f.result() for f in futures]):
+        _cache_put(key, result)  # never cache a partial result
     return result
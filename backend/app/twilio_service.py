@@ -2,8 +2,14 @@
 
 import logging
 import os
+from functools import lru_cache
 from urllib.parse import quote
 
+try:
+    from twilio.rest import Client
+except ImportError:
+    Client = None
+
 logger = logging.getLogger(__name__)
 
 # ── Defaults ──────────────────────────────────────────────────────────────
@@ -12,6 +18,12 @@ DEFAULT_MESSAGING_SERVICE_SID = "MGbeabe48cb26d252c506513ebe01f22b9"
 ZONE_ALERT_BODY = "Intruder detected! check dashboard in analyst area"
 
 
+@lru_cache(maxsize=4)
+def get_client(account_sid: str, auth_token: str):
+    """Shared Twilio client per (sid, token), so its HTTP connection pool is reused across alerts."""
+    return Client(account_sid, auth_token)
+
+
 def send_zone_alert_sms(
     zone_name: str,
     alert_type: str,
@@ -31,6 +43,9 @@ def send_zone_alert_sms(
     if not account_sid or not auth_token:
         logger.warning("TWILIO_ACCOUNT_SID / TWILIO_AUTH_TOKEN not set – skipping SMS")
         return False
+    if Client is None:
+        logger.warning("twilio not installed – skipping SMS")
+        return False
 
     to_number = os.environ.get("TWILIO_ALERT_TO", DEFAULT_ALERT_TO)
     messaging_service_sid = os.environ.get(
@@ -38,9 +53,7 @@ def send_zone_alert_sms(
     )
 
     try:
-        from twilio.rest import Client
-
-        client = Client(account_sid, auth_token)
+        client = get_client(account_sid, auth_token)
         message = client.messages.create(
             body=ZONE_ALERT_BODY,
             to=to_number,
@@ -79,6 +92,9 @@ def send_escalation_sms(
     if not account_sid or not auth_token:
         logger.warning("TWILIO creds not set – skipping escalation SMS")
         return False
+    if Client is None:
+        logger.warning("twilio not installed – skipping escalation SMS")
+        return False
 
     to_number = os.environ.get("TWILIO_ALERT_TO", DEFAULT_ALERT_TO)
     messaging_service_sid = os.environ.get(
@@ -90,9 +106,7 @@ def send_escalation_sms(
     )
 
     try:
-        from twilio.rest import Client
-
-        client = Client(account_sid, auth_token)
+        client = get_client(account_sid, auth_token)
         message = client.messages.create(
             body=body,
             to=to_number,
@@ -133,6 +147,9 @@ def send_escalation_voice_call(
     if not account_sid or not auth_token:
         logger.warning("TWILIO creds not set – skipping escalation voice call")
         return False
+    if Client is None:
+        logger.warning("twilio not installed – skipping escalation voice call")
+        return False
 
     to_number = os.environ.get("TWILIO_ALERT_TO", DEFAULT_ALERT_TO)
 
@@ -158,9 +175,7 @@ def send_escalation_voice_call(
     )
 
     try:
-        from twilio.rest import Client
-
-        client = Client(account_sid, auth_token)
+        client = get_client(account_sid, auth_token)
 
         # Get a Twilio phone number from the account to use as caller ID
         from_number = os.environ.get("TWILIO_FROM_NUMBER", "")
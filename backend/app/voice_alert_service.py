@@ -16,10 +16,21 @@ If any are missing, voice alerts are skipped (no exception).
 """
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Sequence
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+from app.twilio_service import Client, get_client as _twilio_client
 
 logger = logging.getLogger(__name__)
 
@@ -29,11 +40,16 @@ VIOLATION_MESSAGE = (
     "please visit the dashboard to acknowledge or resolve the security issue!"
 )
 
+# Pooled keep-alive connection to api.elevenlabs.io, shared by every TTS call.
+_HTTP = requests.Session() if requests is not None else None
+
 
+@lru_cache(maxsize=1)
 def _get_elevenlabs_key() -> str | None:
     return os.environ.get("ELEVENLABS_API_KEY") or os.environ.get("XI_API_KEY")
 
 
+@lru_cache(maxsize=1)
 def _get_twilio_config() -> tuple[str, str, str] | None:
     sid = os.environ.get("TWILIO_ACCOUNT_SID")
     token = os.environ.get("TWILIO_AUTH_TOKEN")
@@ -43,15 +59,23 @@ def _get_twilio_config() -> tuple[str, str, str] | None:
     return None
 
 
-def _get_c_level_phones() -> List[str]:
+@lru_cache(maxsize=1)
+def _get_c_level_phones() -> tuple[str, ...]:
     raw = os.environ.get("C_LEVEL_PHONE_NUMBERS", "")
-    return [p.strip() for p in raw.split(",") if p.strip()]
+    return tuple(p.strip() for p in raw.split(",") if p.strip())
 
 
+@lru_cache(maxsize=1)
 def _get_public_base_url() -> str | None:
     return os.environ.get("PUBLIC_BASE_URL") or os.environ.get("BASE_URL")
 
 
+def reset_env_cache() -> None:
+    """Drop memoized env lookups (for tests or after the environment changes)."""
+    for fn in (_get_elevenlabs_key, _get_twilio_config, _get_c_level_phones, _get_public_base_url):
+        fn.cache_clear()
+
+
 def generate_announcement_mp3(
     alert_id: str,
     message: str,
@@ -61,21 +85,28 @@ def generate_announcement_mp3(
     """
     Generate TTS with ElevenLabs and save to recordings/{alert_id}_announcement.mp3.
     Returns path to the file, or None if ElevenLabs is not configured or fails.
+
+    The audio only depends on (voice_id, message), so the first synthesis is kept as
+    a template in recordings/ and later alerts copy it instead of calling ElevenLabs.
     """
     api_key = _get_elevenlabs_key()
     if not api_key:
         logger.debug("ElevenLabs API key not set; skipping TTS")
         return None
 
-    try:
-        import requests
-    except ImportError:
+    if _HTTP is None:
         logger.warning("requests not installed; cannot call ElevenLabs")
         return None
 
     rec_dir = data_dir / "recordings"
     rec_dir.mkdir(parents=True, exist_ok=True)
     out_path = rec_dir / f"{alert_id}_announcement.mp3"
+    digest = hashlib.sha1(message.encode("utf-8")).hexdigest()[:16]
+    template = rec_dir / f"_tts_{voice_id}_{digest}.mp3"
+    if template.is_file():
+        shutil.copyfile(template, out_path)
+        logger.debug("Reused cached TTS %s for alert %s", template.name, alert_id)
+        return out_path
 
     url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
     params = {"output_format": "mp3_44100_128"}
@@ -90,9 +121,16 @@ def generate_announcement_mp3(
     }
 
     try:
-        r = requests.post(url, params=params, headers=headers, json=payload, timeout=30)
-        r.raise_for_status()
-        out_path.write_bytes(r.content)
+        tmp_path = template.with_name(f"{template.name}.{alert_id}.part")
+        with _HTTP.post(
+            url, params=params, headers=headers, json=payload, timeout=30, stream=True
+        ) as r:
+            r.raise_for_status()
+            r.raw.decode_content = True
+            with open(tmp_path, "wb") as fp:
+                shutil.copyfileobj(r.raw, fp, length=65536)
+        tmp_path.replace(template)
+        shutil.copyfile(template, out_path)
         logger.info("ElevenLabs TTS saved to %s", out_path)
         return out_path
     except Exception as e:
@@ -103,7 +141,7 @@ def generate_announcement_mp3(
 def trigger_violation_calls(
     alert_id: str,
     public_base_url: str,
-    phone_numbers: List[str],
+    phone_numbers: Sequence[str],
 ) -> None:
     """
     Place outbound Twilio call to each number. When the call is answered, Twilio
@@ -122,14 +160,13 @@ def trigger_violation_calls(
     base = public_base_url.rstrip("/")
     twiml_url = f"{base}/api/security/voice/twiml/{alert_id}"
 
-    try:
-        from twilio.rest import Client
-    except ImportError:
+    if Client is None:
         logger.warning("twilio not installed; cannot place call")
         return
 
-    client = Client(sid, token)
-    for to_num in phone_numbers:
+    client = _twilio_client(sid, token)
+
+    def _place(to_num: str) -> None:
         try:
             client.calls.create(
                 to=to_num,
@@ -142,6 +179,10 @@ def trigger_violation_calls(
         except Exception as e:
             logger.exception("Twilio call to %s failed: %s", to_num, e)
 
+    # Each create is a blocking HTTPS round-trip; fan them out so N numbers cost ~one RTT.
+    with ThreadPoolExecutor(max_workers=min(8, len(phone_numbers))) as ex:
+        list(ex.map(_place, phone_numbers))
+
 
 def trigger_analyst_zone_voice_alert(alert_id: str, data_dir: Path) -> None:
     """
@@ -149,8 +190,7 @@ def trigger_analyst_zone_voice_alert(alert_id: str, data_dir: Path) -> None:
     1. Generate MP3 with ElevenLabs (exact violation message).
     2. If PUBLIC_BASE_URL and Twilio + phones are set, place call(s).
 
-    Safe to call from sync code; runs in same process (TTS is fast; Twilio
-    create is a quick HTTP call – the actual ringing is asynchronous).
+    Blocks for the TTS and Twilio round-trips; schedule it with FastAPI's BackgroundTasks.
     """
     path = generate_announcement_mp3(alert_id, VIOLATION_MESSAGE, data_dir)
     if not path:
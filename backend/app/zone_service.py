@@ -8,17 +8,25 @@ Workflow per frame:
      - "line" zones   : fire alert when a person crosses from one side of the line to the other.
   3. Caller (main.py) decides whether to log unauthorized crossings to security_service.
 
-Person-tracking uses a simple per-frame index (p0, p1 …). This is stable enough for line-side
-tracking between consecutive frames at 400 ms intervals when there are few people.
+Line-side tracking follows each person across frames by greedy IoU matching of their bbox to
+the previous frame's (per feed), so people entering, leaving or being re-ordered by YOLO do not
+trade sides and fire false crossings.
 """
 from __future__ import annotations
 
-import io
+import itertools
+import os
 import time
 from pathlib import Path
 
 import numpy as np
-from PIL import Image
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+from app.body_tracker import iou_matrix
 
 # ---------------------------------------------------------------------------
 # Per-feed state for line-crossing detection
@@ -26,12 +34,18 @@ from PIL import Image
 # ---------------------------------------------------------------------------
 _person_sides: dict[int, dict[str, dict[str, str]]] = {}
 
+# {feed_id: (previous frame's person bboxes (P, 4) in pixels, track key per bbox)}
+_person_tracks: dict[int, tuple[np.ndarray, list[str]]] = {}
+_TRACK_IOU = 0.1  # min IoU for a bbox to continue a previous frame's track
+_TRACK_MAX_SHIFT = 0.5  # fallback: max centre shift, as a fraction of the previous bbox height
+_track_ids = itertools.count()
+
 # ---------------------------------------------------------------------------
 # Alert log-cooldown  (seconds) – prevents flooding the log when a person
 # stands still inside a zone or paces back and forth across a line.
 # ---------------------------------------------------------------------------
 _ALERT_COOLDOWN = 15.0
-_last_alert_log: dict[str, float] = {}  # key = f"{feed_id}:{zone_id}"
+_last_alert_log: dict[tuple[int, str], float] = {}  # (feed_id, zone_id) → monotonic time
 
 
 def _is_role_authorized(role: str | None, auth_roles: list[str]) -> bool:
@@ -50,12 +64,47 @@ _model = None
 _model_error: str | None = None
 
 
+_MODELS_DIR = Path(__file__).resolve().parent.parent / "data" / "models"
+
+# Exported yolov8n builds, fastest first. Export with e.g.
+#   yolo export model=yolov8n.pt format=engine half=True batch=16   (TensorRT FP16)
+#   yolo export model=yolov8n.pt format=onnx dynamic=True           (ONNX Runtime, CPU)
+# dynamic/batch matter: detect_persons_batch sends several feeds per forward pass.
+# For CPU-only hosts, an INT8 build of the ONNX export runs on the same ONNX Runtime path:
+#   python -c "from onnxruntime.quantization import quantize_dynamic, QuantType; \
+#              quantize_dynamic('yolov8n.onnx', 'yolov8n_int8.onnx', weight_type=QuantType.QUInt8)"
+# (or quantize_static with a few calibration frames for the best accuracy).
+_PERSON_MODEL_CANDIDATES_GPU = ("yolov8n.engine", "yolov8n.onnx", "yolov8n_int8.onnx")
+_PERSON_MODEL_CANDIDATES_CPU = ("yolov8n_int8.onnx", "yolov8n.onnx")
+
+
+def _has_cuda() -> bool:
+    try:
+        import torch
+    except ImportError:
+        return False
+    return bool(torch.cuda.is_available())
+
+
+def _person_model_path() -> str:
+    """YOLO_MODEL_PATH if set, else an exported yolov8n (cwd or data/models), else yolov8n.pt."""
+    env = os.environ.get("YOLO_MODEL_PATH")
+    if env:
+        return env
+    candidates = _PERSON_MODEL_CANDIDATES_GPU if _has_cuda() else _PERSON_MODEL_CANDIDATES_CPU
+    for name in candidates:
+        for d in (Path.cwd(), _MODELS_DIR):
+            if (d / name).is_file():
+                return str(d / name)
+    return "yolov8n.pt"
+
+
 def _load_person_model():
     try:
         from ultralytics import YOLO
     except ImportError as e:
         raise RuntimeError("pip install ultralytics") from e
-    return YOLO("yolov8n.pt")
+    return YOLO(_person_model_path(), task="detect")
 
 
 def get_person_model():
@@ -77,83 +126,245 @@ def get_person_model():
 # ---------------------------------------------------------------------------
 
 def _to_bgr(image_bytes: bytes) -> np.ndarray:
-    import cv2
-    img = Image.open(io.BytesIO(image_bytes)).convert("RGB")
-    return cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
+    """Decode straight to BGR with OpenCV (libjpeg-turbo); no PIL image or RGB->BGR copy."""
+    if cv2 is None:
+        raise RuntimeError("pip install opencv-python-headless")
+    img = cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_COLOR)
+    if img is None:
+        raise ValueError("could not decode image")
+    return img
 
 
 # ---------------------------------------------------------------------------
 # Geometry
 # ---------------------------------------------------------------------------
 
-def _point_in_polygon(px: float, py: float, polygon: list[list[float]]) -> bool:
-    """Ray-casting algorithm. polygon = [[x, y], ...] in normalized 0-1 coords."""
-    if len(polygon) < 3:
-        return False
-    n = len(polygon)
-    inside = False
-    j = n - 1
-    for i in range(n):
-        xi, yi = polygon[i]
-        xj, yj = polygon[j]
-        if ((yi > py) != (yj > py)) and (
-            px < (xj - xi) * (py - yi) / ((yj - yi) if yj != yi else 1e-10) + xi
-        ):
-            inside = not inside
-        j = i
-    return inside
+def _points_in_polygon(pts: np.ndarray, poly: np.ndarray) -> np.ndarray:
+    """
+    Vectorized ray-casting: pts (M, 2) against poly (V, 2), both normalized 0-1.
+    Returns an (M,) bool array: the even-odd crossing test, evaluated for every
+    point × edge pair at once and XOR-reduced along the edge axis.
+    """
+    if len(poly) < 3:
+        return np.zeros(len(pts), dtype=bool)
+    xi, yi = poly[:, 0], poly[:, 1]
+    xj, yj = np.roll(xi, 1), np.roll(yi, 1)
+    px, py = pts[:, 0, None], pts[:, 1, None]
+    dy = np.where(yj != yi, yj - yi, 1e-10)
+    crosses = ((yi > py) != (yj > py)) & (px < (xj - xi) * (py - yi) / dy + xi)
+    return np.logical_xor.reduce(crosses, axis=1)
 
 
-def _line_side(px: float, py: float, x1: float, y1: float, x2: float, y2: float) -> float:
-    """Cross-product sign: positive on one side, negative on the other."""
-    return (x2 - x1) * (py - y1) - (y2 - y1) * (px - x1)
+def _convex_orientation(poly: np.ndarray) -> int:
+    """
+    +1 / -1 if poly (V, 2) is a convex polygon (counter-/clockwise in array coords),
+    0 otherwise: every turn has the same sign and the turns add up to one full
+    revolution (rules out self-intersecting stars). Collinear vertices are allowed.
+    """
+    e = np.roll(poly, -1, axis=0) - poly
+    en = np.roll(e, -1, axis=0)
+    cross = e[:, 0] * en[:, 1] - e[:, 1] * en[:, 0]
+    turns = cross[np.abs(cross) > 1e-12]
+    if not len(turns) or not (np.all(turns > 0) or np.all(turns < 0)):
+        return 0
+    if abs(abs(np.arctan2(cross, (e * en).sum(axis=1)).sum()) - 2 * np.pi) > 1e-6:
+        return 0
+    return 1 if turns[0] > 0 else -1
+
+
+def _points_in_convex(pts: np.ndarray, poly: np.ndarray, orientation: int) -> np.ndarray:
+    """
+    Convex fast path for _points_in_polygon: a point is inside when it is on the inner
+    side of every edge (edge × (point - vertex) has the polygon's orientation sign).
+    Branch-free; boundary points count as inside.
+    """
+    e = np.roll(poly, -1, axis=0) - poly
+    cross = (
+        e[None, :, 0] * (pts[:, 1, None] - poly[None, :, 1])
+        - e[None, :, 1] * (pts[:, 0, None] - poly[None, :, 0])
+    )
+    return np.all(cross * orientation >= 0, axis=1)
+
+
+def _greedy_match(cost: np.ndarray, limit: float, keys: list, prev_keys: list[str], used: set[int]) -> None:
+    """Assign prev_keys to unkeyed rows of cost (rows: current, cols: previous), lowest cost first."""
+    for flat in np.argsort(cost, axis=None).tolist():
+        c, q = divmod(flat, cost.shape[1])
+        if cost[c, q] > limit:
+            break
+        if keys[c] is None and q not in used:
+            keys[c] = prev_keys[q]
+            used.add(q)
+
+
+def _track_keys(feed_id: int, pb: np.ndarray) -> list[str]:
+    """
+    Stable key per person bbox, matched against the previous frame's bboxes for this feed:
+    greedy best IoU first (>= _TRACK_IOU); leftovers then by nearest centre, if it moved less
+    than _TRACK_MAX_SHIFT of the previous bbox height (fast lateral walkers overlap little
+    between frames). Unmatched bboxes start new tracks.
+    """
+    keys: list[str | None] = [None] * len(pb)
+    prev = _person_tracks.get(feed_id)
+    if prev is not None and len(prev[1]) and len(pb):
+        qb, prev_keys = prev
+        used: set[int] = set()
+        _greedy_match(-iou_matrix(pb, qb), -_TRACK_IOU, keys, prev_keys, used)
+        if None in keys and len(used) < len(prev_keys):
+            pc = (pb[:, :2] + pb[:, 2:]) / 2
+            qc = (qb[:, :2] + qb[:, 2:]) / 2
+            qh = np.maximum(qb[:, 3] - qb[:, 1], 1e-6)
+            shift = np.hypot(pc[:, None, 0] - qc[None, :, 0], pc[:, None, 1] - qc[None, :, 1]) / qh[None, :]
+            _greedy_match(shift, _TRACK_MAX_SHIFT, keys, prev_keys, used)
+    for i, k in enumerate(keys):
+        if k is None:
+            keys[i] = f"t{next(_track_ids)}"
+    _person_tracks[feed_id] = (pb, keys)
+    return keys
+
+
+# ---------------------------------------------------------------------------
+# Zone geometry, converted once per zone list
+# feed_id → (zones list it was built from, [geometry per zone])
+# camera_zones_store hands back the same list object until the zones file changes,
+# so an identity check is enough to know the arrays are still current.
+# When the list does change (any zone edited), each zone's arrays are looked up in
+# _zone_geom_by_id and only rebuilt if that zone's type/points actually changed.
+# ---------------------------------------------------------------------------
+ZoneGeom = tuple[np.ndarray | None, int]  # (geometry, convex orientation for polygons else 0)
+
+_zone_geom: dict[int, tuple[list[dict], list[ZoneGeom]]] = {}
+_zone_geom_by_id: dict[str, tuple[int, ZoneGeom]] = {}  # zone id → (shape hash, geometry)
+
+
+def _build_geometry(zone_type: str, points) -> ZoneGeom:
+    try:
+        if zone_type == "polygon" and len(points) >= 3:
+            poly = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 2)
+            return poly, _convex_orientation(poly)
+        if zone_type == "line" and len(points) >= 2:
+            return np.asarray(points[:2], dtype=np.float64).reshape(4), 0
+    except (TypeError, ValueError):
+        pass
+    return None, 0
+
+
+def _zone_geometry(zone: dict) -> ZoneGeom:
+    zone_type = zone.get("zone_type", "polygon")
+    points = zone.get("points", [])
+    try:
+        shape = hash((zone_type, tuple(tuple(p) for p in points)))
+    except TypeError:
+        return _build_geometry(zone_type, points)
+    zone_id = zone.get("id")
+    cached = _zone_geom_by_id.get(zone_id) if zone_id else None
+    if cached is not None and cached[0] == shape:
+        return cached[1]
+    geom = _build_geometry(zone_type, points)
+    if zone_id:
+        _zone_geom_by_id[zone_id] = (shape, geom)
+    return geom
+
+
+def _geometry_for(feed_id: int, zones: list[dict]) -> list[ZoneGeom]:
+    """
+    Per-zone (geometry, convex orientation). Geometry is a float64 array: polygon vertices
+    (V, 2) or line endpoints [x1, y1, x2, y2]; None for zones with too few points to test.
+    Orientation is ±1 for convex polygons (see _convex_orientation), else 0.
+    """
+    cached = _zone_geom.get(feed_id)
+    if cached is not None and cached[0] is zones:
+        return cached[1]
+    geoms = [_zone_geometry(zone) for zone in zones]
+    _zone_geom[feed_id] = (zones, geoms)
+    _prune_zone_geom()
+    return geoms
+
+
+def _prune_zone_geom() -> None:
+    """Drop _zone_geom_by_id entries for zones no feed's current list contains (deleted/re-created)."""
+    live = {zone.get("id") for zones, _ in _zone_geom.values() for zone in zones}
+    for zid in [zid for zid in _zone_geom_by_id if zid not in live]:
+        del _zone_geom_by_id[zid]
 
 
 # ---------------------------------------------------------------------------
 # Person detection
 # ---------------------------------------------------------------------------
 
-def detect_persons(image_bytes: bytes) -> list[dict]:
+def _persons_from_result(r) -> list[dict]:
+    """Convert one ultralytics Results object into person dicts."""
+    if r.boxes is None or len(r.boxes) == 0:
+        return []
+    # One device→host copy per tensor for the whole frame, not one per box.
+    xyxy = r.boxes.xyxy.cpu().numpy().tolist()
+    confs = r.boxes.conf.cpu().numpy().tolist()
+    persons = []
+    for (x1, y1, x2, y2), conf in zip(xyxy, confs):
+        cx = (x1 + x2) / 2
+        cy = (y1 + y2) / 2
+        persons.append({
+            "bbox": [x1, y1, x2, y2],
+            "feet": [cx, y2],  # bottom of bounding box ≈ feet position
+            "center": [cx, cy],
+            "conf": conf,
+        })
+    return persons
+
+
+def detect_persons(image_bytes: bytes, bgr: np.ndarray | None = None) -> list[dict]:
     """
     Run YOLOv8n on image and return person detections.
     Returns list of:
       { bbox:[x1,y1,x2,y2], feet:[cx,by], center:[cx,cy], conf:float }
-    All values are in pixel coordinates.
+    All values are in pixel coordinates. Pass bgr to reuse an already-decoded frame.
     """
     model = get_person_model()
     if model is None:
         return []
-    try:
-        bgr = _to_bgr(image_bytes)
-    except Exception:
-        return []
+    if bgr is None:
+        try:
+            bgr = _to_bgr(image_bytes)
+        except Exception:
+            return []
     try:
         results = model.predict(bgr, conf=0.50, classes=[0], verbose=False)
     except Exception:
         return []
     persons = []
     for r in results:
-        if r.boxes is None:
-            continue
-        for box in r.boxes:
-            try:
-                xyxy = box.xyxy[0].cpu().numpy().tolist()
-                conf = float(box.conf[0].cpu().numpy())
-                x1, y1, x2, y2 = xyxy
-                cx = (x1 + x2) / 2
-                cy = (y1 + y2) / 2
-                by = y2  # bottom of bounding box ≈ feet position
-                persons.append({
-                    "bbox": [float(v) for v in xyxy],
-                    "feet": [cx, by],
-                    "center": [cx, cy],
-                    "conf": conf,
-                })
-            except Exception:
-                continue
+        persons.extend(_persons_from_result(r))
     return persons
 
 
+def detect_persons_batch(images: list[bytes | np.ndarray]) -> list[list[dict]]:
+    """
+    Batched detect_persons: one YOLO forward pass over several frames (e.g. one per feed).
+    Items may be encoded bytes or decoded BGR arrays.
+    Returns one person list per input, in order; undecodable frames yield [].
+    """
+    out: list[list[dict]] = [[] for _ in images]
+    model = get_person_model()
+    if model is None or not images:
+        return out
+    idx, arrs = [], []
+    for i, b in enumerate(images):
+        try:
+            arrs.append(b if isinstance(b, np.ndarray) else _to_bgr(b))
+            idx.append(i)
+        except Exception:
+            continue
+    if not arrs:
+        return out
+    try:
+        results = model.predict(arrs, conf=0.50, classes=[0], verbose=False)
+    except Exception:
+        return out
+    for i, r in zip(idx, results):
+        out[i] = _persons_from_result(r)
+    return out
+
+
 # ---------------------------------------------------------------------------
 # Zone crossing check
 # ---------------------------------------------------------------------------
@@ -163,15 +374,20 @@ def check_zones(
     feed_id: int,
     zones: list[dict],
     faces: list[dict] | None = None,
+    bgr: np.ndarray | None = None,
+    persons: list[dict] | None = None,
 ) -> list[dict]:
     """
     Detect persons in the frame and check each active zone for violations.
 
     Args:
         image_bytes: Raw image bytes for this frame.
+        bgr: Optional already-decoded frame; when given, image_bytes is not decoded.
         feed_id: Camera feed index (used for per-feed side-tracking state).
         zones: Active camera zones for this feed (from camera_zones_store).
         faces: Optional face detections to correlate identity with zone violations.
+        persons: Optional detect_persons output for this same frame (e.g. from the batched
+            detector); when given, YOLO is not run again.
 
     Returns:
         List of zone_alert dicts. Includes both authorized and unauthorized alerts
@@ -183,67 +399,83 @@ def check_zones(
         person_name, person_role, authorized (bool)
     """
     if not zones:
+        _person_sides.pop(feed_id, None)
+        _person_tracks.pop(feed_id, None)
+        if _zone_geom.pop(feed_id, None) is not None:
+            _prune_zone_geom()
         return []
 
-    try:
-        arr = _to_bgr(image_bytes)
-    except Exception:
-        return []
+    if bgr is None:
+        try:
+            bgr = _to_bgr(image_bytes)
+        except Exception:
+            return []
 
-    h, w = arr.shape[:2]
+    h, w = bgr.shape[:2]
     if w == 0 or h == 0:
         return []
 
-    persons = detect_persons(image_bytes)
+    if persons is None:
+        persons = detect_persons(image_bytes, bgr=bgr)
+    else:
+        persons = [dict(p) for p in persons]  # caller's dicts stay untouched by feet_n/center_n
     if not persons:
         # Clean stale side-tracking for this feed when no one is visible
         if feed_id in _person_sides:
             _person_sides[feed_id] = {}
+        _person_tracks.pop(feed_id, None)
         return []
 
-    # Normalize feet/center to 0-1
-    for p in persons:
-        p["feet_n"] = [p["feet"][0] / w, p["feet"][1] / h]
-        p["center_n"] = [p["center"][0] / w, p["center"][1] / h]
+    # Everything per person is derived from the bboxes once, before the zone loop:
+    # normalized bboxes, corners (top-left, top-right, bottom-left, bottom-right) as one
+    # (P*4, 2) array for the polygon tests, and feet (bottom-centre) as (P, 2) for lines.
+    pb = np.asarray([p["bbox"] for p in persons], dtype=np.float64)
+    bb = pb / (w, h, w, h)
+    corners_n = bb[:, [0, 1, 2, 1, 0, 3, 2, 3]].reshape(-1, 2)
+    feet_n = np.column_stack(((bb[:, 0] + bb[:, 2]) / 2, bb[:, 3]))
+    center_n = (bb[:, :2] + bb[:, 2:]) / 2
+    for p, fn, cn in zip(persons, feet_n.tolist(), center_n.tolist()):
+        p["feet_n"] = fn
+        p["center_n"] = cn
+    geoms = _geometry_for(feed_id, zones)
+    track_keys = _track_keys(feed_id, pb)
 
     # ---------------------------------------------------------------------------
     # Match face detections to persons by spatial overlap (face is upper portion
-    # of the person bbox). Returns (name, role, authorized) or (None, None, None).
+    # of the person bbox): the fraction of each face inside each person bbox, for
+    # every (person, face) pair in one broadcast. Per person: (name, role, authorized)
+    # of the best face covering > 25 %, else (None, None, None).
     # ---------------------------------------------------------------------------
-    def face_for_person(pbbox: list[float]):
-        if not faces:
-            return None, None, None
-        px1, py1, px2, py2 = pbbox
-        best_ov, best_f = 0.0, None
-        for f in faces:
-            fx1, fy1, fx2, fy2 = f.get("bbox", [0, 0, 0, 0])
-            iw = min(fx2, px2) - max(fx1, px1)
-            ih = min(fy2, py2) - max(fy1, py1)
-            if iw > 0 and ih > 0:
-                fa = (fx2 - fx1) * (fy2 - fy1)
-                ov = (iw * ih) / fa if fa > 0 else 0.0
-                if ov > best_ov:
-                    best_ov = ov
-                    best_f = f
-        if best_f and best_ov > 0.25:
-            return best_f.get("name"), best_f.get("role"), best_f.get("authorized")
-        return None, None, None
+    identities: list[tuple] = [(None, None, None)] * len(persons)
+    if faces:
+        fb = np.asarray([f.get("bbox", [0, 0, 0, 0]) for f in faces], dtype=np.float64).reshape(-1, 4)
+        iw = np.minimum(pb[:, None, 2], fb[None, :, 2]) - np.maximum(pb[:, None, 0], fb[None, :, 0])
+        ih = np.minimum(pb[:, None, 3], fb[None, :, 3]) - np.maximum(pb[:, None, 1], fb[None, :, 1])
+        fa = (fb[:, 2] - fb[:, 0]) * (fb[:, 3] - fb[:, 1])
+        ov = np.where((iw > 0) & (ih > 0) & (fa > 0), iw * ih / np.where(fa > 0, fa, 1.0), 0.0)
+        best = ov.argmax(axis=1)
+        for i, j in enumerate(best.tolist()):
+            if ov[i, j] > 0.25:
+                f = faces[j]
+                identities[i] = (f.get("name"), f.get("role"), f.get("authorized"))
 
     # ---------------------------------------------------------------------------
-    # Per-feed side-tracking dict
+    # Per-feed side-tracking dict; state for zones deleted (or moved off this
+    # feed) since the last frame is dropped so it can't accumulate over uptime.
     # ---------------------------------------------------------------------------
-    if feed_id not in _person_sides:
-        _person_sides[feed_id] = {}
+    feed_sides = _person_sides.setdefault(feed_id, {})
+    active_ids = {zone.get("id", "") for zone in zones}
+    for zid in [zid for zid in feed_sides if zid not in active_ids]:
+        del feed_sides[zid]
 
     alerts: list[dict] = []
 
-    for zone in zones:
+    for zone, (geom, convex) in zip(zones, geoms):
         if not zone.get("active", True):
             continue
 
         zone_id = zone.get("id", "")
         zone_type = zone.get("zone_type", "polygon")
-        points = zone.get("points", [])
         zone_name = zone.get("name", "Restricted Zone")
         auth_roles = zone.get("authorized_roles", [])
 
@@ -252,12 +484,33 @@ def check_zones(
 
         current_person_keys: set[str] = set()
 
+        # Polygon zone: every person's four corners tested in one vectorized pass.
+        # All four corners inside means the bbox lies within the polygon's bounding box,
+        # so only those candidates are tested (edge-sign test for convex zones, else ray-cast).
+        if zone_type == "polygon" and geom is not None:
+            (zx1, zy1), (zx2, zy2) = geom.min(axis=0), geom.max(axis=0)
+            cand = (bb[:, 0] >= zx1) & (bb[:, 1] >= zy1) & (bb[:, 2] <= zx2) & (bb[:, 3] <= zy2)
+            inside = np.zeros(len(persons), dtype=bool)
+            if cand.any():
+                pts = corners_n.reshape(-1, 4, 2)[cand].reshape(-1, 2)
+                hits = _points_in_convex(pts, geom, convex) if convex else _points_in_polygon(pts, geom)
+                inside[cand] = hits.reshape(-1, 4).all(axis=1)
+        else:
+            inside = None
+
+        # Line zone: which side of the line every person's feet are on, in one pass
+        # (sign of the cross product of the line direction with line-start -> feet).
+        if zone_type == "line" and geom is not None:
+            x1, y1, x2, y2 = geom
+            on_a = ((x2 - x1) * (feet_n[:, 1] - y1) - (y2 - y1) * (feet_n[:, 0] - x1) >= 0).tolist()
+        else:
+            on_a = None
+
         for i, person in enumerate(persons):
-            track_key = f"p{i}"
+            track_key = track_keys[i]
             current_person_keys.add(track_key)
-            fx, fy = person["feet_n"]
 
-            name, role, face_auth = face_for_person(person["bbox"])
+            name, role, face_auth = identities[i]
             # C-Level/Admin bypass all zones; others checked against auth_roles
             authorized = _is_role_authorized(role, auth_roles)
 
@@ -266,15 +519,8 @@ def check_zones(
             # Requires ALL FOUR corners of the person bbox to be inside the
             # polygon so that merely clipping an edge doesn't trigger an alert.
             # ------------------------------------------------------------------
-            if zone_type == "polygon" and len(points) >= 3:
-                bx1, by1, bx2, by2 = person["bbox"]
-                corners_n = [
-                    (bx1 / w, by1 / h),  # top-left
-                    (bx2 / w, by1 / h),  # top-right
-                    (bx1 / w, by2 / h),  # bottom-left
-                    (bx2 / w, by2 / h),  # bottom-right
-                ]
-                if all(_point_in_polygon(cx, cy, points) for cx, cy in corners_n):
+            if inside is not None:
+                if inside[i]:
                     alerts.append({
                         "zone_id": zone_id,
                         "zone_name": zone_name,
@@ -290,11 +536,8 @@ def check_zones(
             # ------------------------------------------------------------------
             # Line zone: crossing detection
             # ------------------------------------------------------------------
-            elif zone_type == "line" and len(points) >= 2:
-                x1, y1 = points[0]
-                x2, y2 = points[1]
-                side_val = _line_side(fx, fy, x1, y1, x2, y2)
-                current_side = "A" if side_val >= 0 else "B"
+            elif on_a is not None:
+                current_side = "A" if on_a[i] else "B"
 
                 prev_side = _person_sides[feed_id][zone_id].get(track_key)
                 _person_sides[feed_id][zone_id][track_key] = current_side
@@ -327,9 +570,10 @@ def should_log_alert(feed_id: int, zone_id: str) -> bool:
     since the last logged alert for this (feed, zone) pair.
     Prevents flooding the alert log when a person stands in a zone for a long time.
     """
-    key = f"{feed_id}:{zone_id}"
-    now = time.time()
-    if now - _last_alert_log.get(key, 0.0) >= _ALERT_COOLDOWN:
+    key = (feed_id, zone_id)
+    now = time.monotonic()
+    last = _last_alert_log.get(key)
+    if last is None or now - last >= _ALERT_COOLDOWN:
         _last_alert_log[key] = now
         return True
     return False